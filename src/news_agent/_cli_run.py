@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+import click
+
+if TYPE_CHECKING:
+    from news_agent.config.models import Config
+    from news_agent.output.terminal import TerminalDisplay
+
+CACHE_DIR = Path(".cache/news-agent")
+
+
+@click.command()
+@click.option(
+    '--config',
+    type=click.Path(exists=True, path_type=Path),
+    default='config.toml',
+    help='Path to configuration file'
+)
+@click.option(
+    '--output',
+    type=click.Path(path_type=Path),
+    default=None,
+    help='Output file path (default: reports/report-{date}.md)'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Force fetch fresh data, ignore cache'
+)
+@click.option(
+    '--depth',
+    type=click.Choice(['lightweight', 'medium', 'deep']),
+    default=None,
+    help='Analysis depth (overrides config)'
+)
+@click.option(
+    '--sources',
+    type=str,
+    default=None,
+    help='Comma-separated list of sources (e.g., github,hn)'
+)
+@click.option(
+    '--dry-run',
+    is_flag=True,
+    help='Show what would be fetched without running'
+)
+@click.option(
+    '--verbose',
+    is_flag=True,
+    help='Enable verbose logging'
+)
+def run(
+    config: Path,
+    output: Path | None,
+    no_cache: bool,
+    depth: str | None,
+    sources: str | None,
+    dry_run: bool,
+    verbose: bool
+) -> None:
+    """Run the news agent to collect and analyze content"""
+    from news_agent.config import load_config
+    from news_agent.output.terminal import TerminalDisplay
+
+    display = TerminalDisplay()
+
+    try:
+        # Load configuration
+        display.show_progress("Loading configuration...")
+        cfg = load_config(config)
+
+        # Apply overrides
+        if depth:
+            cfg = cfg.model_copy(update={
+                "analysis": cfg.analysis.model_copy(update={"depth": depth})
+            })
+
+        if dry_run:
+            enabled_sources = [
+                s for s in ('github', 'hackernews') if getattr(cfg.sources, s).enabled
+            ]
+            display.batch_messages([
+                ("warning", "Dry run mode - no data will be fetched"),
+                ("progress", f"Would fetch from sources: {', '.join(enabled_sources)}")
+            ])
+            return
+
+        _run_pipeline(cfg, display, output, no_cache, verbose)
+
+    except Exception as e:
+        import sys
+
+        display.show_error(f"Error: {str(e)}")
+        if verbose:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
+
+
+def _run_pipeline(
+    cfg: Config,
+    display: TerminalDisplay,
+    output: Path | None,
+    no_cache: bool,
+    verbose: bool
+) -> None:
+    """Fetch, analyze, and report; heavy imports live here so --help and --dry-run stay fast"""
+    import os
+    import logging
+    from dotenv import load_dotenv
+
+    # Load environment variables
+    load_dotenv()
+
+    # Enable LangSmith tracing if API key is configured
+    if os.getenv("LANGSMITH_API_KEY"):
+        os.environ["LANGSMITH_TRACING"] = "true"
+
+    # Configure logging based on verbose flag; records go through the display's console
+    # so they don't garble the status spinner
+    if verbose:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(message)s',  # Simple format for clean output
+            handlers=[display.logging_handler()],
+            force=True  # Override any existing configuration
+        )
+    else:
+        logging.basicConfig(
+            level=logging.WARNING, handlers=[display.logging_handler()], force=True
+        )
+
+    from news_agent import llm, mcp
+    from news_agent.cache.manager import CacheManager
+    from news_agent.analysis.relevance import RelevanceScorer
+    from news_agent.analysis.ranking import Ranker
+    from news_agent.agent.tools import ToolRegistry
+    from news_agent.agent.react_agent import NewsAgent
+    from news_agent.output.markdown import MarkdownGenerator
+
+    # Initialize components
+    display.show_progress("Initializing components...")
+
+    cache_manager = CacheManager(CACHE_DIR, cfg.caching)
+    llm_provider = llm.LLMProvider(cfg.llm, cache_manager)
+
+    if no_cache:
+        display.show_progress("Clearing cache (--no-cache flag)")
+        cache_manager.clear()
+
+    github_client = mcp.GitHubMCPClient(cfg.sources.github)
+    hn_client = mcp.HackerNewsMCPClient(cfg.sources.hackernews, cache_manager)
+
+    relevance_scorer = RelevanceScorer(llm_provider, cfg.analysis)
+    ranker = Ranker(cfg.ranking)
+
+    tool_registry = ToolRegistry(
+        github_client,
+        hn_client,
+        relevance_scorer,
+        ranker,
+        cache_manager
+    )
+
+    # Create agent
+    agent = NewsAgent(cfg, tool_registry, llm_provider)
+
+    # Run agent (LangSmith tracing is enabled via LANGSMITH_TRACING env var if configured)
+    try:
+        with display.status("Running news agent..."):
+            results = agent.run(no_cache=no_cache)
+    finally:
+        llm_provider.close()
+
+    # Display preview
+    if cfg.output.terminal_preview:
+        if results["github_repos"]:
+            display.show_github_preview(results["github_repos"])
+
+        if results["hn_posts"]:
+            display.show_hn_preview(results["hn_posts"])
+
+    # Generate markdown report
+    display.show_progress("Generating markdown report...")
+    markdown_gen = MarkdownGenerator()
+    report_content = markdown_gen.generate_report(results)
+
+    # Determine output path
+    if output:
+        output_path = output
+    else:
+        from datetime import datetime
+
+        timestamp = datetime.now().strftime("%Y-%m-%d")
+        output_path = cfg.output.save_dir / f"report-{timestamp}.md"
+
+    # Save report (creating the reports directory if needed)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Encode explicitly: the report has emoji, and write_text would use the locale codec
+    output_path.write_bytes(report_content.encode('utf-8'))
+
+    # Show summary
+    display.show_summary({
+        "github_count": len(results["github_repos"]),
+        "hn_count": len(results["hn_posts"]),
+        "depth": cfg.analysis.depth,
+        "report_path": str(output_path)
+    })
+
+    display.show_success(f"Report saved to: {output_path}")
@@ -1,6 +1,7 @@
+import asyncio
 import logging
 from typing import Any
-from langsmith import traceable
+from news_agent.utils.tracing import traceable
 from news_agent.config.models import Config
 from news_agent.agent.tools import ToolRegistry
 from news_agent.llm.provider import LLMProvider
@@ -31,6 +32,10 @@ class NewsAgent:
         Returns:
             Dictionary with collected and analyzed data
         """
+        return asyncio.run(self._run(no_cache))
+
+    async def _run(self, no_cache: bool) -> dict[str, Any]:
+        """Run the workflow on a single event loop, closing pooled connections on exit"""
         results = {
             "github_repos": [],
             "hn_posts": [],
@@ -40,74 +45,100 @@ class NewsAgent:
             }
         }
 
-        # GitHub collection
+        # Sources are independent, so collect them concurrently
+        collectors = []
         if self.config.sources.github.enabled:
-            github_data = self._collect_github_data(no_cache)
-            results["github_repos"] = github_data
-            results["metadata"]["sources"].append("github")
-
-        # Hacker News collection
+            collectors.append(("github", "github_repos", self._collect_github_data))
         if self.config.sources.hackernews.enabled:
-            hn_data = self._collect_hn_data(no_cache)
-            results["hn_posts"] = hn_data
-            results["metadata"]["sources"].append("hackernews")
+            collectors.append(("hackernews", "hn_posts", self._collect_hn_data))
+
+        try:
+            async with self.tools:
+                collected = await asyncio.gather(*[
+                    asyncio.create_task(collect(no_cache)) for _, _, collect in collectors
+                ])
+        finally:
+            await self.llm.aclose()
+
+        for (source, key, _), data in zip(collectors, collected):
+            results[key] = data
+            results["metadata"]["sources"].append(source)
 
         return results
 
     @traceable(name="collect_github_data")
-    def _collect_github_data(self, no_cache: bool) -> list[dict[str, Any]]:
+    async def _collect_github_data(self, no_cache: bool) -> list[dict[str, Any]]:
         """Collect and analyze GitHub trending data"""
         logger.info("🔍 Starting GitHub data collection...")
 
         # Fetch trending repos
         logger.info("📡 Calling GitHub API to fetch trending repositories...")
-        result = self.tools.tools["fetch_github_trending"](no_cache=no_cache)
+        result = await self.tools.tools["fetch_github_trending_async"](no_cache=no_cache)
         repos = result["data"]
-        logger.info(f"✓ Retrieved {len(repos)} trending repositories")
+        logger.info("✓ Retrieved %d trending repositories", len(repos))
 
         # Normalize popularity scores (stars)
         if repos:
             # TODO: Add analysis via LLM for project popularity
-            logger.debug(f"   Top repo: {repos[0].get('name')} ({repos[0].get('stars')} stars)")
-            pass
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "   Top repo: %s (%s stars)", repos[0].get('name'), repos[0].get('stars')
+                )
 
         # Take top N
         top_repos = repos[:self.config.analysis.top_n]
-        logger.info(f"📊 Selected top {len(top_repos)} repositories for report")
+        logger.info("📊 Selected top %d repositories for report", len(top_repos))
         return top_repos
 
     @traceable(name="collect_hn_data")
-    def _collect_hn_data(self, no_cache: bool) -> list[dict[str, Any]]:
+    async def _collect_hn_data(self, no_cache: bool) -> list[dict[str, Any]]:
         """Collect and analyze Hacker News data"""
         logger.info("🔍 Starting Hacker News data collection...")
         all_posts = []
 
-        # Fetch from configured endpoints
-        for endpoint in self.config.sources.hackernews.endpoints:
-            logger.info(f"📡 Fetching posts from HN endpoint: {endpoint}")
-            result = self.tools.tools["fetch_hn_posts"](endpoint=endpoint, no_cache=no_cache)
+        # Fetch from configured endpoints concurrently
+        endpoints = self.config.sources.hackernews.endpoints
+        logger.info("📡 Fetching posts from HN endpoints: %s", ", ".join(endpoints))
+        results = await asyncio.gather(*[
+            self.tools.tools["fetch_hn_posts_async"](endpoint=endpoint, no_cache=no_cache)
+            for endpoint in endpoints
+        ])
+        for endpoint, result in zip(endpoints, results):
             all_posts.extend(result["data"])
-            logger.info(f"✓ Retrieved {len(result['data'])} posts from {endpoint}")
+            logger.info("✓ Retrieved %d posts from %s", len(result['data']), endpoint)
 
-        logger.info(f"📚 Total posts collected: {len(all_posts)}")
+        logger.info("📚 Total posts collected: %d", len(all_posts))
+
+        # Endpoints overlap, so drop repeats before paying for relevance scoring
+        unique_posts: dict[Any, dict[str, Any]] = {}
+        for post in all_posts:
+            unique_posts.setdefault(post.get("id"), post)
+        if len(unique_posts) < len(all_posts):
+            logger.info(
+                "🧹 Removed %d duplicate posts (%d/%d unique)",
+                len(all_posts) - len(unique_posts), len(unique_posts), len(all_posts)
+            )
+        all_posts = list(unique_posts.values())
 
         # Score relevance
         topics = self.config.sources.hackernews.filter_topics
-        logger.info(f"🤖 Analyzing relevance to topics: {', '.join(topics)}")
-        logger.info(f"   Calling LLM to score {len(all_posts)} posts...")
-        scored_posts = self.tools.tools["score_relevance"](all_posts, topics)
-        logger.info(f"✓ Relevance scoring complete")
+        logger.info("🤖 Analyzing relevance to topics: %s", ", ".join(topics))
+        logger.info("   Calling LLM to score %d posts...", len(all_posts))
+        # Scoring makes blocking LLM calls; keep them off the loop the GitHub collector shares
+        scored_posts = await asyncio.to_thread(
+            self.tools.tools["score_relevance"], all_posts, topics
+        )
+        logger.info("✓ Relevance scoring complete")
 
         # Filter by relevance threshold
         relevant_posts = [p for p in scored_posts if p.get("relevance_score", 0) > 0.5]
-        logger.info(f"🔬 Filtered to {len(relevant_posts)} posts with relevance > 0.5")
-
-        # Rank posts
-        logger.info(f"📊 Ranking {len(relevant_posts)} relevant posts...")
-        ranked_posts = self.tools.tools["rank_items"](relevant_posts)
-        logger.info(f"✓ Ranking complete (strategy: {self.config.ranking.strategy})")
-
-        # Take top N
-        top_posts = ranked_posts[:self.config.analysis.top_n]
-        logger.info(f"📝 Selected top {len(top_posts)} posts for report")
+        logger.info("🔬 Filtered to %d posts with relevance > 0.5", len(relevant_posts))
+
+        # Rank posts, keeping only the top N
+        logger.info("📊 Ranking %d relevant posts...", len(relevant_posts))
+        top_posts = self.tools.tools["rank_items"](
+            relevant_posts, top_n=self.config.analysis.top_n
+        )
+        logger.info("✓ Ranking complete (strategy: %s)", self.config.ranking.strategy)
+        logger.info("📝 Selected top %d posts for report", len(top_posts))
         return top_posts
@@ -1,4 +1,8 @@
-from typing import Any, Callable
+import asyncio
+import hashlib
+import re
+from collections.abc import Callable
+from typing import Any
 from news_agent.mcp.github_client import GitHubMCPClient
 from news_agent.mcp.hn_client import HackerNewsMCPClient
 from news_agent.analysis.relevance import RelevanceScorer
@@ -6,6 +10,23 @@ from news_agent.analysis.ranking import Ranker
 from news_agent.cache.manager import CacheManager
 
 
+def _compile_topic_pattern(topics: list[str]) -> re.Pattern[str]:
+    """Compile topics into one case-insensitive substring pattern"""
+    # No word boundaries: plurals ("LLMs") and compounds ("OpenAI") have to match,
+    # the same way the HN client's topic filter matches them
+    alternatives = "|".join(re.escape(t) for t in sorted(topics, key=len, reverse=True))
+    return re.compile(alternatives, re.IGNORECASE)
+
+
+def _relevance_cache_key(item: dict[str, Any], topics_hash: str) -> str:
+    """Build the per-post relevance cache key, scoped to the topic set"""
+    item_id = item.get("id")
+    if item_id is None:
+        identity = f"{item.get('title', '')}|{item.get('url', '')}"
+        item_id = hashlib.sha256(identity.encode()).hexdigest()
+    return f"relevance:{item_id}:{topics_hash}"
+
+
 class ToolRegistry:
     """Registry of tools available to the agent"""
 
@@ -25,11 +46,23 @@ class ToolRegistry:
 
         self.tools = self._register_tools()
 
+    async def aclose(self) -> None:
+        """Close the pooled connections held by the MCP clients"""
+        await asyncio.gather(self.github_client.aclose(), self.hn_client.aclose())
+
+    async def __aenter__(self) -> "ToolRegistry":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     def _register_tools(self) -> dict[str, Callable]:
         """Register all available tools"""
         return {
             "fetch_github_trending": self._fetch_github_trending,
+            "fetch_github_trending_async": self._fetch_github_trending_async,
             "fetch_hn_posts": self._fetch_hn_posts,
+            "fetch_hn_posts_async": self._fetch_hn_posts_async,
             "score_relevance": self._score_relevance,
             "rank_items": self._rank_items,
         }
@@ -51,6 +84,23 @@ class ToolRegistry:
 
         return {"source": "mcp", "data": repos}
 
+    async def _fetch_github_trending_async(self, **kwargs: Any) -> dict[str, Any]:
+        """Tool: Fetch GitHub trending repositories without blocking the event loop"""
+        cache_key = "github_trending"
+
+        # Check cache
+        cached = self.cache.get(cache_key)
+        if cached and not kwargs.get("no_cache"):
+            return {"source": "cache", "data": cached}
+
+        # Fetch fresh data
+        repos = await self.github_client.fetch_trending_repositories_async()
+
+        # Cache results
+        self.cache.set(cache_key, repos)
+
+        return {"source": "mcp", "data": repos}
+
     def _fetch_hn_posts(self, endpoint: str = "newest", **kwargs: Any) -> dict[str, Any]:
         """Tool: Fetch Hacker News posts"""
         cache_key = f"hn_{endpoint}"
@@ -68,14 +118,71 @@ class ToolRegistry:
 
         return {"source": "mcp", "data": posts}
 
-    def _score_relevance(self, items: list[dict[str, Any]], topics: list[str], **kwargs: Any) -> list[dict[str, Any]]:
+    async def _fetch_hn_posts_async(
+        self, endpoint: str = "newest", **kwargs: Any
+    ) -> dict[str, Any]:
+        """Tool: Fetch Hacker News posts without blocking the event loop"""
+        cache_key = f"hn_{endpoint}"
+
+        # Check cache
+        cached = self.cache.get(cache_key)
+        if cached and not kwargs.get("no_cache"):
+            return {"source": "cache", "data": cached}
+
+        # Fetch fresh data
+        posts = await self.hn_client.fetch_posts_async(endpoint)
+
+        # Cache results
+        self.cache.set(cache_key, posts)
+
+        return {"source": "mcp", "data": posts}
+
+    def _score_relevance(
+        self, items: list[dict[str, Any]], topics: list[str], **kwargs: Any
+    ) -> list[dict[str, Any]]:
         """Tool: Score relevance of items"""
-        for item in items:
-            score = self.relevance_scorer.score_hn_post(item, topics)
-            item["relevance_score"] = score
+        # Posts that never mention a topic are scored 0.0 without an LLM call
+        candidates = items
+        if topics:
+            pattern = _compile_topic_pattern(topics)
+            candidates = []
+            for item in items:
+                blob = f"{item.get('title', '')} {(item.get('text') or '')[:500]}"
+                if pattern.search(blob):
+                    candidates.append(item)
+                else:
+                    item["relevance_score"] = 0.0
+
+        # Reuse scores from previous runs; changing topics invalidates them
+        topics_hash = hashlib.sha256("\n".join(sorted(topics)).encode()).hexdigest()[:16]
+        to_score = []
+        for item in candidates:
+            cached = self.cache.get_item(_relevance_cache_key(item, topics_hash))
+            if cached is not None:
+                item["relevance_score"] = cached
+            else:
+                to_score.append(item)
+
+        batch_size = self.relevance_scorer.config.relevance_batch_size
+        batches = [
+            to_score[start:start + batch_size]
+            for start in range(0, len(to_score), batch_size)
+        ]
+        batch_scores = self.relevance_scorer.score_hn_posts_batches(batches, topics)
+        for batch, scores in zip(batches, batch_scores):
+            for item, score in zip(batch, scores):
+                item["relevance_score"] = score if score is not None else 0.0
+            # Unparseable replies score 0.0 for this run only, so the next run retries them
+            self.cache.set_items({
+                _relevance_cache_key(item, topics_hash): score
+                for item, score in zip(batch, scores)
+                if score is not None
+            })
 
         return items
 
-    def _rank_items(self, items: list[dict[str, Any]], **kwargs: Any) -> list[dict[str, Any]]:
+    def _rank_items(
+        self, items: list[dict[str, Any]], top_n: int | None = None, **kwargs: Any
+    ) -> list[dict[str, Any]]:
         """Tool: Rank items based on configured strategy"""
-        return self.ranker.rank(items)
+        return self.ranker.rank(items, top_n=top_n)
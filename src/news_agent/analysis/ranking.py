@@ -1,3 +1,6 @@
+import heapq
+from operator import itemgetter
+from collections.abc import Callable
 from typing import Any
 from news_agent.config.models import RankingConfig
 
@@ -8,44 +11,72 @@ class Ranker:
     def __init__(self, config: RankingConfig):
         self.config = config
 
-    def rank(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def rank(self, items: list[dict[str, Any]], top_n: int | None = None) -> list[dict[str, Any]]:
         """Rank items based on configured strategy
 
         Args:
             items: List of items with relevance_score and/or popularity_score
+            top_n: Only return the N highest ranked items (default: all)
 
         Returns:
             Sorted list of items (highest ranked first)
         """
         if self.config.strategy == "popularity":
-            return self._rank_by_popularity(items)
+            return self._rank_by_popularity(items, top_n)
         elif self.config.strategy == "relevance":
-            return self._rank_by_relevance(items)
+            return self._rank_by_relevance(items, top_n)
         else:  # balanced
-            return self._rank_balanced(items)
-
-    def _rank_by_popularity(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            return self._rank_balanced(items, top_n)
+
+    def _top(
+        self,
+        items: list[dict[str, Any]],
+        key: Callable[[dict[str, Any]], float],
+        top_n: int | None
+    ) -> list[dict[str, Any]]:
+        """Select the highest scoring items, avoiding a full sort when only top N are needed"""
+        if top_n is None:
+            return sorted(items, key=key, reverse=True)
+        return heapq.nlargest(top_n, items, key=key)
+
+    def _rank_by_popularity(
+        self, items: list[dict[str, Any]], top_n: int | None = None
+    ) -> list[dict[str, Any]]:
         """Rank by popularity score only"""
-        return sorted(items, key=lambda x: x.get("popularity_score", 0), reverse=True)
+        return self._top(items, lambda x: x.get("popularity_score", 0), top_n)
 
-    def _rank_by_relevance(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _rank_by_relevance(
+        self, items: list[dict[str, Any]], top_n: int | None = None
+    ) -> list[dict[str, Any]]:
         """Rank by relevance score only"""
-        return sorted(items, key=lambda x: x.get("relevance_score", 0), reverse=True)
+        return self._top(items, lambda x: x.get("relevance_score", 0), top_n)
 
-    def _rank_balanced(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _rank_balanced(
+        self, items: list[dict[str, Any]], top_n: int | None = None
+    ) -> list[dict[str, Any]]:
         """Rank by weighted combination of relevance and popularity"""
-        def calculate_score(item: dict[str, Any]) -> float:
-            relevance = item.get("relevance_score", 0)
-            popularity = item.get("popularity_score", 0)
-
-            return (
-                relevance * self.config.weights.relevance +
-                popularity * self.config.weights.popularity
+        relevance_weight = self.config.weights.relevance
+        popularity_weight = self.config.weights.popularity
+
+        # Compute every combined score up front so the sort key is a plain lookup
+        keyed = [
+            (
+                item.get("relevance_score", 0) * relevance_weight +
+                item.get("popularity_score", 0) * popularity_weight,
+                item
             )
-
-        return sorted(items, key=calculate_score, reverse=True)
-
-    def normalize_scores(self, items: list[dict[str, Any]], score_field: str) -> list[dict[str, Any]]:
+            for item in items
+        ]
+
+        if top_n is None:
+            keyed.sort(key=itemgetter(0), reverse=True)
+        else:
+            keyed = heapq.nlargest(top_n, keyed, key=itemgetter(0))
+        return [item for _, item in keyed]
+
+    def normalize_scores(
+        self, items: list[dict[str, Any]], score_field: str
+    ) -> list[dict[str, Any]]:
         """Normalize scores to 0-1 range
 
         Args:
@@ -58,6 +89,7 @@ class Ranker:
         if not items:
             return items
 
+        normalized_field = f"{score_field}_normalized"
         scores = [item.get(score_field, 0) for item in items]
         min_score = min(scores)
         max_score = max(scores)
@@ -65,12 +97,11 @@ class Ranker:
         if max_score == min_score:
             # All scores are the same
             for item in items:
-                item[f"{score_field}_normalized"] = 0.5
+                item[normalized_field] = 0.5
             return items
 
-        for item in items:
-            original = item.get(score_field, 0)
-            normalized = (original - min_score) / (max_score - min_score)
-            item[f"{score_field}_normalized"] = normalized
+        score_range = max_score - min_score
+        for item, score in zip(items, scores):
+            item[normalized_field] = (score - min_score) / score_range
 
         return items
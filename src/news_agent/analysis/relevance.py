@@ -1,8 +1,16 @@
-import json
-import re
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+import orjson
 from news_agent.llm.provider import LLMProvider
 from news_agent.config.models import AnalysisConfig
+from news_agent.utils.json_extract import extract_json_object
+
+logger = logging.getLogger(__name__)
+
+# Scoring responses are tiny JSON objects, so cap generation tightly
+_SCORE_MAX_TOKENS = 32
+_BATCH_SCORE_TOKENS_PER_POST = 24
 
 
 class RelevanceScorer:
@@ -12,7 +20,7 @@ class RelevanceScorer:
         self.llm = llm_provider
         self.config = config
 
-    def score_hn_post(self, post: dict[str, Any], topics: list[str]) -> float:
+    def score_hn_post(self, post: dict[str, Any], topics: list[str]) -> float | None:
         """Score a Hacker News post's relevance to specified topics
 
         Args:
@@ -20,7 +28,7 @@ class RelevanceScorer:
             topics: List of topics to check relevance against
 
         Returns:
-            Relevance score between 0.0 and 1.0
+            Relevance score between 0.0 and 1.0, or None if the reply couldn't be parsed
         """
         prompt = self._build_relevance_prompt(post, topics)
 
@@ -28,37 +36,88 @@ class RelevanceScorer:
             {"role": "user", "content": prompt}
         ]
 
-        response = self.llm.complete_json(messages, temperature=0.3)
+        response = self.llm.complete_json(
+            messages, temperature=0.0, max_tokens=_SCORE_MAX_TOKENS
+        )
         result = self._extract_json(response)
+        if result is None:
+            logger.warning(f"Unparseable relevance reply for {post.get('title', 'N/A')!r}")
+            return None
 
-        return float(result.get("relevance_score", 0.0))
-
-    def _extract_json(self, text: str) -> dict[str, Any]:
-        """Extract JSON from text, handling markdown code blocks and extra text"""
-        # Try to parse as-is first
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
-
-        # Try to extract from markdown code block
-        json_match = re.search(r'```(?:json)?\s*\n?(.*?)\n?```', text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                pass
-
-        # Try to find JSON object in text
-        brace_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if brace_match:
-            try:
-                return json.loads(brace_match.group(0))
-            except json.JSONDecodeError:
-                pass
-
-        # Fallback: return default
-        return {"relevance_score": 0.0, "reasoning": "Failed to parse response", "key_topics": []}
+            return float(result["relevance_score"])
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Relevance reply without a score for {post.get('title', 'N/A')!r}")
+            return None
+
+    def score_hn_posts_batch(
+        self, posts: list[dict[str, Any]], topics: list[str]
+    ) -> list[float | None]:
+        """Score several Hacker News posts' relevance with a single LLM call
+
+        Args:
+            posts: List of post dictionaries with title, url, text
+            topics: List of topics to check relevance against
+
+        Returns:
+            Relevance scores between 0.0 and 1.0, in the same order as posts; None where
+            no reply could be parsed
+        """
+        if not posts:
+            return []
+
+        prompt = self._build_batch_relevance_prompt(posts, topics)
+
+        messages = [
+            {"role": "user", "content": prompt}
+        ]
+
+        response = self.llm.complete_json(
+            messages,
+            temperature=0.0,
+            max_tokens=_SCORE_MAX_TOKENS + _BATCH_SCORE_TOKENS_PER_POST * len(posts)
+        )
+        result = self._extract_json(response)
+
+        scores_by_id: dict[int, float] = {}
+        entries = result.get("scores") if result is not None else None
+        if isinstance(entries, list):
+            for entry in entries:
+                try:
+                    scores_by_id[int(entry["id"])] = float(entry["relevance_score"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+        # Fall back to per-post scoring for anything the batch response missed
+        return [
+            scores_by_id[i] if i in scores_by_id else self.score_hn_post(post, topics)
+            for i, post in enumerate(posts)
+        ]
+
+    def score_hn_posts_batches(
+        self, batches: list[list[dict[str, Any]]], topics: list[str]
+    ) -> list[list[float | None]]:
+        """Score several batches of posts, running up to relevance_concurrency LLM calls at once
+
+        Args:
+            batches: Lists of post dictionaries, each scored with one LLM call
+            topics: List of topics to check relevance against
+
+        Returns:
+            Relevance scores for each batch, in the same order as batches
+        """
+        workers = min(self.config.relevance_concurrency, len(batches))
+        if workers <= 1:
+            return [self.score_hn_posts_batch(batch, topics) for batch in batches]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda batch: self.score_hn_posts_batch(batch, topics), batches
+            ))
+
+    def _extract_json(self, text: str) -> dict[str, Any] | None:
+        """Extract a JSON object from text, or None if the text holds none"""
+        return extract_json_object(text)
 
     def _build_relevance_prompt(self, post: dict[str, Any], topics: list[str]) -> str:
         """Build prompt for relevance scoring"""
@@ -70,18 +129,33 @@ Post Title: {post.get('title', 'N/A')}
 Post URL: {post.get('url', 'N/A')}
 Post Text: {post.get('text', 'N/A')[:500]}
 
-Analyze how relevant this post is to {topics_str}. Consider:
-- Direct mentions or discussions of these topics
-- Related concepts, tools, or techniques
-- Practical applications or research
-- Community interest and significance
-
-Return a JSON object with:
-{{
-  "relevance_score": <float between 0.0 and 1.0>,
-  "reasoning": "<brief explanation>",
-  "key_topics": ["<topic1>", "<topic2>"]
-}}
+Return only {{"relevance_score": <float between 0.0 and 1.0>}}
+
+Score 1.0 = Highly relevant (directly about topic)
+Score 0.5 = Moderately relevant (tangentially related)
+Score 0.0 = Not relevant (unrelated)"""
+
+    def _build_batch_relevance_prompt(self, posts: list[dict[str, Any]], topics: list[str]) -> str:
+        """Build prompt for scoring a batch of posts in one call"""
+        topics_str = ", ".join(topics)
+        # Compact separators; whitespace between fields only costs prompt tokens
+        posts_json = orjson.dumps([
+            {
+                "id": i,
+                "title": post.get('title', 'N/A'),
+                "url": post.get('url', 'N/A'),
+                "text": (post.get('text') or '')[:500]
+            }
+            for i, post in enumerate(posts)
+        ]).decode()
+
+        return f"""Score the relevance of each of these Hacker News posts to topics: {topics_str}
+
+Posts:
+{posts_json}
+
+Return only {{"scores": [{{"id": <post id>, "relevance_score": <float between 0.0 and 1.0>}}]}}
+with one entry per post, using the post ids given above.
 
 Score 1.0 = Highly relevant (directly about topic)
 Score 0.5 = Moderately relevant (tangentially related)
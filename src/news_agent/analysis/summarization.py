@@ -1,6 +1,8 @@
 from typing import Any
+import orjson
 from news_agent.llm.provider import LLMProvider
 from news_agent.config.models import AnalysisConfig
+from news_agent.utils.json_extract import extract_json_object
 
 
 class Summarizer:
@@ -49,12 +51,67 @@ class Summarizer:
         max_tokens = self._get_max_tokens_for_depth()
         return self.llm.complete(messages, temperature=0.5, max_tokens=max_tokens)
 
+    def summarize_articles_batch(self, articles: list[dict[str, Any]]) -> list[str]:
+        """Summarize several articles, packing up to summary_batch_size into each LLM call
+
+        Args:
+            articles: List of article dictionaries with title, url, text
+
+        Returns:
+            Summaries in the same order as articles
+        """
+        summaries: list[str] = []
+        batch_size = self.config.summary_batch_size
+        for start in range(0, len(articles), batch_size):
+            summaries.extend(self._summarize_batch(articles[start:start + batch_size]))
+        return summaries
+
+    def _summarize_batch(self, articles: list[dict[str, Any]]) -> list[str]:
+        """Summarize one batch of articles with a single LLM call"""
+        if len(articles) == 1:
+            return [self.summarize_article(articles[0])]
+
+        prompt = self._build_batch_summary_prompt(articles)
+
+        messages = [
+            {"role": "user", "content": prompt}
+        ]
+
+        response = self.llm.complete_json(
+            messages,
+            temperature=0.5,
+            max_tokens=64 + self._get_max_tokens_for_depth() * len(articles)
+        )
+
+        summaries_by_id: dict[int, str] = {}
+        result = extract_json_object(response)
+        entries = result.get("summaries") if result is not None else None
+        if isinstance(entries, list):
+            for entry in entries:
+                try:
+                    summary = entry["summary"]
+                    if isinstance(summary, str) and summary:
+                        summaries_by_id[int(entry["id"])] = summary
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+        # Fall back to a single-article call for anything the batch response missed
+        return [
+            summaries_by_id[i] if i in summaries_by_id else self.summarize_article(article)
+            for i, article in enumerate(articles)
+        ]
+
     def _build_article_summary_prompt(self, article: dict[str, Any]) -> str:
         """Build prompt for article summarization"""
         depth_instructions = {
             "lightweight": "Provide a one-sentence summary (max 50 words).",
-            "medium": "Provide a concise summary (2-3 sentences, max 100 words) covering key points.",
-            "deep": "Provide a comprehensive summary (4-5 sentences, max 200 words) including context, implications, and significance."
+            "medium": (
+                "Provide a concise summary (2-3 sentences, max 100 words) covering key points."
+            ),
+            "deep": (
+                "Provide a comprehensive summary (4-5 sentences, max 200 words) including "
+                "context, implications, and significance."
+            )
         }
 
         instruction = depth_instructions.get(self.config.depth, depth_instructions["medium"])
@@ -67,6 +124,37 @@ Content: {article.get('text', 'N/A')[:2000]}
 
 {instruction}"""
 
+    def _build_batch_summary_prompt(self, articles: list[dict[str, Any]]) -> str:
+        """Build prompt for summarizing a batch of articles in one call"""
+        depth_instructions = {
+            "lightweight": "a one-sentence summary (max 50 words)",
+            "medium": "a concise summary (2-3 sentences, max 100 words) covering key points",
+            "deep": (
+                "a comprehensive summary (4-5 sentences, max 200 words) including context, "
+                "implications, and significance"
+            )
+        }
+
+        instruction = depth_instructions.get(self.config.depth, depth_instructions["medium"])
+        # Compact separators; whitespace between fields only costs prompt tokens
+        articles_json = orjson.dumps([
+            {
+                "id": i,
+                "title": article.get('title', 'N/A'),
+                "url": article.get('url', 'N/A'),
+                "content": (article.get('text') or '')[:2000]
+            }
+            for i, article in enumerate(articles)
+        ]).decode()
+
+        return f"""Summarize each of these articles, giving {instruction} for each.
+
+Articles:
+{articles_json}
+
+Return only {{"summaries": [{{"id": <article id>, "summary": "<summary>"}}]}}
+with one entry per article, using the article ids given above."""
+
     def _build_comments_summary_prompt(self, comments: list[dict[str, Any]]) -> str:
         """Build prompt for comment summarization"""
         comments_text = "\n\n".join([
@@ -77,7 +165,10 @@ Content: {article.get('text', 'N/A')[:2000]}
         depth_instructions = {
             "lightweight": "List 2-3 key discussion themes (one sentence).",
             "medium": "Summarize main discussion themes and notable perspectives (2-3 sentences).",
-            "deep": "Provide detailed analysis of discussion themes, sentiment, consensus/disagreement, and notable insights (4-5 sentences)."
+            "deep": (
+                "Provide detailed analysis of discussion themes, sentiment, "
+                "consensus/disagreement, and notable insights (4-5 sentences)."
+            )
         }
 
         instruction = depth_instructions.get(self.config.depth, depth_instructions["medium"])
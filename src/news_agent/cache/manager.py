@@ -1,27 +1,86 @@
-import json
 import time
-import hashlib
 import logging
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any
+import orjson
+import zstandard as zstd
 from news_agent.config.models import CachingConfig
 
 logger = logging.getLogger(__name__)
 
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS entries "
+    "(key TEXT PRIMARY KEY, timestamp REAL NOT NULL, data BLOB)",
+    "CREATE TABLE IF NOT EXISTS items "
+    "(key TEXT PRIMARY KEY, timestamp REAL NOT NULL, data BLOB)",
+)
+
+# Every zstd frame starts with this magic number, so compressed payloads can be told
+# apart from plain JSON written by older versions of the cache
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZSTD_LEVEL = 3
+
+# Keys per "WHERE key IN (...)" lookup, below SQLite's oldest bound-parameter limit (999)
+_MAX_KEYS_PER_QUERY = 500
+
 
 class CacheManager:
-    """Manages file-based caching with TTL support"""
+    """Manages SQLite-backed caching with TTL support"""
 
     def __init__(self, cache_dir: Path, config: CachingConfig):
         self.cache_dir = cache_dir
         self.config = config
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._db: sqlite3.Connection | None = None
+        # One connection is shared by scorer worker threads; serialize every use of it
+        self._lock = threading.RLock()
+        self._compressor = zstd.ZstdCompressor(level=_ZSTD_LEVEL)
+        self._decompressor = zstd.ZstdDecompressor()
+
+    def _get_db(self) -> sqlite3.Connection:
+        """Open the cache database on first use"""
+        with self._lock:
+            if self._db is None:
+                db = sqlite3.connect(self.cache_dir / "cache.db", check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                for statement in _SCHEMA:
+                    db.execute(statement)
+                self._db = db
+            return self._db
+
+    def close(self) -> None:
+        """Close the cache database"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
 
-    def _get_cache_path(self, key: str) -> Path:
-        """Get cache file path for given key using hash to prevent collisions"""
-        # Use SHA256 hash to create safe, collision-resistant filenames
-        key_hash = hashlib.sha256(key.encode('utf-8')).hexdigest()
-        return self.cache_dir / f"{key_hash}.json"
+    def _read(self, table: str, key: str, ttl_hours: int) -> Any | None:
+        """Read an unexpired value from table, deleting it if it has expired"""
+        with self._lock:
+            db = self._get_db()
+            row = db.execute(
+                f"SELECT timestamp, data FROM {table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            timestamp, data = row
+            age_hours = (time.time() - timestamp) / 3600
+            if age_hours > ttl_hours:
+                with db:
+                    db.execute(f"DELETE FROM {table} WHERE key = ?", (key,))
+                return None
+
+            if data is None:
+                raise KeyError("data")
+            if data[:4] == _ZSTD_MAGIC:
+                # zstd (de)compressor objects are not thread-safe either
+                data = self._decompressor.decompress(data)
+        return orjson.loads(data)
 
     def set(self, key: str, data: Any) -> None:
         """Store data in cache with current timestamp"""
@@ -29,85 +88,161 @@ class CacheManager:
             return
 
         try:
-            cache_path = self._get_cache_path(key)
-            cache_data = {
-                "timestamp": time.time(),
-                "data": data
-            }
-
-            with open(cache_path, 'w') as f:
-                json.dump(cache_data, f)
+            serialized = orjson.dumps(data)
+            with self._lock:
+                payload = self._compressor.compress(serialized)
+                db = self._get_db()
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                        (key, time.time(), payload)
+                    )
         except (TypeError, ValueError) as e:
             # JSON serialization error
             logger.warning(f"Failed to serialize cache data for key '{key}': {e}")
-        except (IOError, OSError) as e:
-            # File I/O error
-            logger.warning(f"Failed to write cache file for key '{key}': {e}")
+        except (sqlite3.Error, OSError) as e:
+            # Database error
+            logger.warning(f"Failed to write cache entry for key '{key}': {e}")
         except Exception as e:
             # Catch any other unexpected errors
             logger.error(f"Unexpected error caching data for key '{key}': {e}")
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str) -> Any | None:
         """Retrieve data from cache if not expired"""
         if not self.config.enabled:
             return None
 
         try:
-            cache_path = self._get_cache_path(key)
-
-            if not cache_path.exists():
-                return None
-
-            with open(cache_path, 'r') as f:
-                cache_data = json.load(f)
-
-            # Check if expired
-            age_hours = (time.time() - cache_data["timestamp"]) / 3600
-            if age_hours > self.config.ttl_hours:
-                cache_path.unlink()
-                return None
-
-            return cache_data["data"]
-        except json.JSONDecodeError as e:
-            # Corrupted JSON file
-            logger.warning(f"Corrupted cache file for key '{key}': {e}")
-            # Try to remove the corrupted file
+            return self._read("entries", key, self.config.ttl_hours)
+        except (orjson.JSONDecodeError, zstd.ZstdError) as e:
+            # Corrupted payload
+            logger.warning(f"Corrupted cache entry for key '{key}': {e}")
+            # Try to remove the corrupted entry
             try:
-                if cache_path.exists():
-                    cache_path.unlink()
+                self.clear(key)
             except Exception:
                 pass
             return None
         except KeyError as e:
-            # Missing required keys in cache data
+            # Missing payload in cache entry
             logger.warning(f"Invalid cache data structure for key '{key}': missing {e}")
             return None
-        except (IOError, OSError) as e:
-            # File I/O error
-            logger.warning(f"Failed to read cache file for key '{key}': {e}")
+        except (sqlite3.Error, OSError) as e:
+            # Database error
+            logger.warning(f"Failed to read cache entry for key '{key}': {e}")
             return None
         except Exception as e:
             # Catch any other unexpected errors
             logger.error(f"Unexpected error retrieving cache for key '{key}': {e}")
             return None
 
-    def clear(self, key: Optional[str] = None) -> None:
+    def set_item(self, key: str, data: Any) -> None:
+        """Store a small per-item value (e.g. one post's relevance score)"""
+        self.set_items({key: data})
+
+    def set_items(self, entries: dict[str, Any]) -> None:
+        """Store several per-item values in a single transaction"""
+        if not self.config.enabled or not entries:
+            return
+
+        try:
+            now = time.time()
+            rows = [(key, now, orjson.dumps(data)) for key, data in entries.items()]
+            with self._lock:
+                db = self._get_db()
+                with db:
+                    db.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?)", rows)
+        except (TypeError, ValueError) as e:
+            # JSON serialization error
+            logger.warning(f"Failed to serialize cache items: {e}")
+        except (sqlite3.Error, OSError) as e:
+            # Database error
+            logger.warning(f"Failed to write cache items: {e}")
+
+    def get_item(self, key: str, ttl_hours: int | None = None) -> Any | None:
+        """Retrieve a per-item value if it has not outlived ttl_hours (default item_ttl_hours)"""
+        if not self.config.enabled:
+            return None
+
+        if ttl_hours is None:
+            ttl_hours = self.config.item_ttl_hours
+
+        try:
+            return self._read("items", key, ttl_hours)
+        except (orjson.JSONDecodeError, zstd.ZstdError, KeyError) as e:
+            logger.warning(f"Corrupted cache item for key '{key}': {e}")
+            return None
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to read cache item for key '{key}': {e}")
+            return None
+
+    def get_items(self, keys: list[str], ttl_hours: int | None = None) -> dict[str, Any]:
+        """Retrieve several per-item values in one query, skipping missing or expired keys
+
+        Args:
+            keys: Item keys to look up
+            ttl_hours: Maximum age of a value (default item_ttl_hours)
+
+        Returns:
+            Mapping of key to value for every key with an unexpired, readable value
+        """
+        if not self.config.enabled or not keys:
+            return {}
+
+        if ttl_hours is None:
+            ttl_hours = self.config.item_ttl_hours
+
+        rows = []
+        expired: set[str] = set()
+        try:
+            with self._lock:
+                db = self._get_db()
+                for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                    chunk = keys[start:start + _MAX_KEYS_PER_QUERY]
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows.extend(db.execute(
+                        f"SELECT key, timestamp, data FROM items WHERE key IN ({placeholders})",
+                        chunk
+                    ).fetchall())
+
+                cutoff = time.time() - ttl_hours * 3600
+                expired = {key for key, timestamp, _ in rows if timestamp < cutoff}
+                if expired:
+                    with db:
+                        db.executemany(
+                            "DELETE FROM items WHERE key = ?", [(key,) for key in expired]
+                        )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to read cache items: {e}")
+            return {}
+
+        values = {}
+        for key, _, data in rows:
+            if key in expired:
+                continue
+            try:
+                if data is None:
+                    raise KeyError("data")
+                values[key] = orjson.loads(data)
+            except (orjson.JSONDecodeError, KeyError) as e:
+                logger.warning(f"Corrupted cache item for key '{key}': {e}")
+        return values
+
+    def clear(self, key: str | None = None) -> None:
         """Clear specific cache entry or all cache"""
         try:
-            if key:
-                # Clear specific cache entry
-                cache_path = self._get_cache_path(key)
-                if cache_path.exists():
-                    cache_path.unlink()
-            else:
-                # Clear all cache entries
-                for cache_file in self.cache_dir.glob("*.json"):
-                    try:
-                        cache_file.unlink()
-                    except (IOError, OSError) as e:
-                        logger.warning(f"Failed to delete cache file '{cache_file}': {e}")
-        except (IOError, OSError) as e:
-            # File deletion error
+            with self._lock:
+                db = self._get_db()
+                with db:
+                    if key:
+                        # Clear specific cache entry
+                        db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    else:
+                        # Clear all cache entries
+                        db.execute("DELETE FROM entries")
+                        db.execute("DELETE FROM items")
+        except (sqlite3.Error, OSError) as e:
+            # Database error
             logger.warning(f"Failed to clear cache for key '{key}': {e}")
         except Exception as e:
             # Catch any other unexpected errors
@@ -0,0 +1,20 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from news_agent.config.loader import load_config
+    from news_agent.config.models import Config
+
+__all__ = ["Config", "load_config"]
+
+# Public name -> submodule; imported on first access so `import news_agent.config` stays cheap
+_LAZY_ATTRS = {
+    "Config": "models",
+    "load_config": "loader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{_LAZY_ATTRS[name]}"), name)
@@ -1,14 +1,75 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
 from pathlib import Path
 import tomli
 from pydantic import ValidationError
+from news_agent.config import models
 from news_agent.config.models import Config
 
+logger = logging.getLogger(__name__)
+
+# Parsed configs are pickled here, keyed by the TOML file's path, mtime and size
+CONFIG_CACHE_DIR = Path("~/.cache/news-agent").expanduser()
+
 
 def load_config(config_path: Path) -> Config:
-    """Load and validate configuration from TOML file"""
+    """Load and validate configuration from TOML file, reusing a cached parse if unchanged"""
+    if os.environ.get("NEWS_AGENT_NO_CFG_CACHE"):
+        return _parse_config(config_path)
+
+    cache_path = _config_cache_path(config_path)
+    if cache_path is not None:
+        try:
+            cached = pickle.loads(cache_path.read_bytes())
+            if isinstance(cached, Config):
+                return cached
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            # Missing, truncated or stale cache entry; parse the TOML instead
+            logger.debug(f"Config cache miss for {config_path}: {e}")
+
+    config = _parse_config(config_path)
+
+    if cache_path is not None:
+        _write_config_cache(cache_path, config)
+    return config
+
+
+def _config_cache_path(config_path: Path) -> Path | None:
+    """Cache file for config_path; changes to the file or the config models miss the cache"""
+    try:
+        stat = config_path.stat()
+        models_stat = Path(models.__file__).stat()
+    except OSError:
+        return None
+
+    key = (
+        f"{config_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:"
+        f"{models_stat.st_mtime_ns}"
+    )
+    return CONFIG_CACHE_DIR / f"cfg-{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+
+
+def _write_config_cache(cache_path: Path, config: Config) -> None:
+    """Atomically write the pickled config; failures only cost a re-parse next time"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, delete=False) as f:
+            f.write(pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(f.name, cache_path)
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def _parse_config(config_path: Path) -> Config:
+    """Parse and validate the TOML file"""
     try:
-        with open(config_path, 'rb') as f:
-            config_dict = tomli.load(f)
+        # Config files are small, so read them in one call and parse from memory
+        config_dict = tomli.loads(config_path.read_bytes().decode('utf-8'))
     except FileNotFoundError:
         raise FileNotFoundError(
             f"Configuration file not found at {config_path}. "
@@ -20,7 +81,7 @@ def load_config(config_path: Path) -> Config:
         )
 
     try:
-        return Config(**config_dict)
+        return Config.model_validate(config_dict)
     except ValidationError as e:
         raise ValidationError.from_exception_data(
             title="Configuration validation failed",
@@ -1,19 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
 from typing import Literal
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+
+# Configs are parsed once and never mutated; unknown keys are usually typos
+_CONFIG_MODEL_CONFIG = ConfigDict(extra='forbid', frozen=True)
 
 
 class LLMConfig(BaseModel):
+    model_config = _CONFIG_MODEL_CONFIG
+
     provider: str
     model: str
     api_key_env: str
+    # Reuse completions for identical requests (in memory, and on disk when caching is enabled)
+    cache_enabled: bool = True
+    # Client-side limits, so calls wait rather than pile into provider 429s (unset = no limit)
+    requests_per_minute: int | None = Field(default=None, ge=1)
+    tokens_per_minute: int | None = Field(default=None, ge=1)
+    # Upper bound for concurrent async calls; halved on rate limits, regrown on success
+    max_concurrency: int = Field(default=16, ge=1, le=64)
 
 
 class AnalysisConfig(BaseModel):
+    model_config = _CONFIG_MODEL_CONFIG
+
     depth: Literal["lightweight", "medium", "deep"] = "medium"
     top_n: int = Field(default=25, ge=1, le=100)
+    relevance_concurrency: int = Field(default=4, ge=1, le=32)
+    # Items packed into one LLM prompt when scoring relevance / summarizing
+    relevance_batch_size: int = Field(default=25, ge=1, le=100)
+    summary_batch_size: int = Field(default=8, ge=1, le=50)
 
 
 class SourceConfig(BaseModel):
+    model_config = _CONFIG_MODEL_CONFIG
+
     enabled: bool = True
 
 
@@ -29,50 +52,78 @@ class HackerNewsSourceConfig(SourceConfig):
 
 
 class SourcesConfig(BaseModel):
+    model_config = _CONFIG_MODEL_CONFIG
+
     github: GitHubSourceConfig = Field(default_factory=GitHubSourceConfig)
     hackernews: HackerNewsSourceConfig = Field(default_factory=HackerNewsSourceConfig)
 
 
 class RankingWeights(BaseModel):
-    relevance: float = Field(default=0.7, ge=0.0, le=1.0)
-    popularity: float = Field(default=0.3, ge=0.0, le=1.0)
+    model_config = _CONFIG_MODEL_CONFIG
 
-    @model_validator(mode='after')
-    def check_weights_sum(self) -> 'RankingWeights':
-        if abs(self.relevance + self.popularity - 1.0) > 0.01:
+    relevance: float = Field(default=0.7, ge=0.0, le=1.0)
+    # validate_default so the sum is still checked when only relevance is set
+    popularity: float = Field(default=0.3, ge=0.0, le=1.0, validate_default=True)
+
+    @field_validator("popularity")
+    @classmethod
+    def check_weights_sum(cls, v: float, info: ValidationInfo) -> float:
+        # relevance is missing here only if it already failed its own validation
+        relevance = info.data.get("relevance")
+        if relevance is not None and abs(relevance + v - 1.0) > 0.01:
             raise ValueError("Weights must sum to 1.0")
-        return self
+        return v
 
 
 class RankingConfig(BaseModel):
+    model_config = _CONFIG_MODEL_CONFIG
+
     strategy: Literal["popularity", "relevance", "balanced"] = "balanced"
     weights: RankingWeights = Field(default_factory=RankingWeights)
 
 
 class CachingConfig(BaseModel):
+    model_config = _CONFIG_MODEL_CONFIG
+
     enabled: bool = True
     ttl_hours: int = Field(default=1, ge=0)
+    item_ttl_hours: int = Field(default=168, ge=0)
 
 
 class OutputConfig(BaseModel):
+    model_config = _CONFIG_MODEL_CONFIG
+
     format: Literal["markdown"] = "markdown"
     save_path: str = "./reports"
     terminal_preview: bool = True
 
+    @property
+    def save_dir(self) -> Path:
+        """save_path as a Path"""
+        return Path(self.save_path)
+
 
 class RetryConfig(BaseModel):
+    model_config = _CONFIG_MODEL_CONFIG
+
     max_attempts: int = Field(default=3, ge=1, le=10)
     backoff_multiplier: int = Field(default=2, ge=1)
+    # Upper bound on a single backoff sleep, so high attempt counts don't stall a run
+    max_delay: float = Field(default=30.0, gt=0)
     graceful_degradation: bool = True
 
 
 class TelemetryConfig(BaseModel):
+    model_config = _CONFIG_MODEL_CONFIG
+
     enabled: bool = True
     backend: Literal["langsmith", "otel", "langfuse"] = "langsmith"
     project_name: str = "news-agent"
 
 
 class Config(BaseModel):
+    model_config = _CONFIG_MODEL_CONFIG
+
     llm: LLMConfig
     analysis: AnalysisConfig = Field(default_factory=AnalysisConfig)
     sources: SourcesConfig = Field(default_factory=SourcesConfig)
@@ -0,0 +1,18 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from news_agent.llm.provider import LLMProvider
+
+__all__ = ["LLMProvider"]
+
+# Public name -> submodule; imported on first access so `import news_agent.llm` stays cheap
+_LAZY_ATTRS = {
+    "LLMProvider": "provider",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{_LAZY_ATTRS[name]}"), name)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+import orjson
+
+if TYPE_CHECKING:
+    from news_agent.cache.manager import CacheManager
+
+logger = logging.getLogger(__name__)
+
+# Completions kept in memory per process; each is at most a few KB of text
+DEFAULT_MEMORY_ENTRIES = 1024
+
+
+class PromptCache:
+    """Content-addressed completion cache: an in-process LRU in front of the on-disk cache"""
+
+    def __init__(
+        self,
+        cache: CacheManager | None = None,
+        enabled: bool = True,
+        maxsize: int = DEFAULT_MEMORY_ENTRIES
+    ):
+        self.cache = cache
+        # caching.enabled = false turns off every layer, not just the disk one
+        self.enabled = enabled and (cache is None or cache.config.enabled)
+        self.maxsize = maxsize
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        # complete() is called from scorer worker threads
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        messages: list[dict[str, Any]],
+        kwargs: dict[str, Any]
+    ) -> str | None:
+        """Cache key for a completion request, or None if it can't be cached"""
+        if not self.enabled:
+            return None
+
+        try:
+            payload = orjson.dumps(
+                [model, temperature, max_tokens, messages, kwargs],
+                option=orjson.OPT_SORT_KEYS
+            )
+        except TypeError:
+            # Non-serializable extra arguments; skip caching rather than guess a key
+            return None
+        return f"llm:{hashlib.blake2b(payload, digest_size=32).hexdigest()}"
+
+    def get(self, key: str | None) -> str | None:
+        """Return the cached completion for key, checking memory before disk"""
+        if key is None:
+            return None
+
+        with self._lock:
+            content = self._memory.get(key)
+            if content is not None:
+                self._memory.move_to_end(key)
+                return content
+
+        if self.cache is None:
+            return None
+        cached = self.cache.get_item(key, ttl_hours=self.cache.config.ttl_hours)
+        if not isinstance(cached, str):
+            return None
+        self._remember(key, cached)
+        return cached
+
+    def set(self, key: str | None, content: str) -> None:
+        """Store a completion in memory and, if configured, on disk"""
+        if key is None:
+            return
+        self._remember(key, content)
+        if self.cache is not None:
+            self.cache.set_item(key, content)
+
+    def _remember(self, key: str, content: str) -> None:
+        """Add to the in-memory LRU, evicting the least recently used entry when full"""
+        with self._lock:
+            self._memory[key] = content
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
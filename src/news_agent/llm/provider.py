@@ -1,34 +1,76 @@
+from __future__ import annotations
+
 import os
+import asyncio
+import functools
 import logging
-from typing import Any, List, Dict
-import litellm
-from langsmith import traceable
-from litellm import completion
-from litellm.exceptions import (
-    AuthenticationError,
-    RateLimitError,
-    Timeout,
-    APIError,
-    BadRequestError
-)
+import threading
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, cast
+from news_agent.utils.tracing import traceable
 from news_agent.config.models import LLMConfig
+from news_agent.llm.cache import PromptCache
+from news_agent.llm.ratelimit import AIMDController, SlidingWindowLimiter
+
+if TYPE_CHECKING:
+    from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
+    from news_agent.cache.manager import CacheManager
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 # Supported LLM providers
-SUPPORTED_PROVIDERS = {"anthropic", "openai", "azure", "cohere", "bedrock", "openrouter", "ollama"}
+SUPPORTED_PROVIDERS = frozenset({
+    "anthropic", "openai", "azure", "cohere", "bedrock", "openrouter", "ollama"
+})
+
+# Providers whose LiteLLM handlers accept a shared HTTPHandler. The OpenAI-compatible
+# ones (openai, azure, openrouter) already reuse LiteLLM's cached SDK clients.
+HTTP_HANDLER_PROVIDERS = frozenset({"anthropic", "cohere", "bedrock", "ollama"})
+
+# Enough idle connections to cover analysis.relevance_concurrency at its maximum
+_MAX_KEEPALIVE_CONNECTIONS = 32
+_MAX_CONNECTIONS = 64
+
+
+@functools.cache
+def _litellm_error_messages() -> dict[type[Exception], tuple[str, str]]:
+    """(log prefix, caller-facing message) per LiteLLM exception type, built on first error"""
+    from litellm.exceptions import (
+        AuthenticationError,
+        RateLimitError,
+        Timeout,
+        APIError,
+        BadRequestError
+    )
+
+    return {
+        AuthenticationError: (
+            "Authentication failed",
+            "Authentication failed. Please check your API key for {provider}"
+        ),
+        RateLimitError: (
+            "Rate limit exceeded",
+            "Rate limit exceeded for {provider}. Please try again later."
+        ),
+        Timeout: ("Request timeout", "Request to {provider} timed out. Please try again."),
+        BadRequestError: ("Bad request", "Invalid request to {provider}: {error}"),
+        APIError: ("API error", "API error from {provider}: {error}"),
+    }
 
 
 class LLMProvider:
     """Wrapper for LiteLLM to support multiple LLM providers"""
 
-    def __init__(self, config: LLMConfig):
+    def __init__(self, config: LLMConfig, cache: CacheManager | None = None):
         self.config = config
         self.model = config.model
+        self.cache = cache
+        self._prompt_cache = PromptCache(cache, enabled=config.cache_enabled)
 
         # Validate provider
-        if config.provider.lower() not in SUPPORTED_PROVIDERS:
+        provider = config.provider.lower()
+        if provider not in SUPPORTED_PROVIDERS:
             raise ValueError(
                 f"Unsupported provider: {config.provider}. "
                 f"Supported providers: {', '.join(sorted(SUPPORTED_PROVIDERS))}"
@@ -44,6 +86,19 @@ class LLMProvider:
         # Store API key in instance variable instead of global environment
         self._api_key = api_key
 
+        # Long-lived HTTP client so repeated calls reuse keep-alive connections
+        self._pooled = provider in HTTP_HANDLER_PROVIDERS
+        self._http: HTTPHandler | None = None
+        # Scorer worker threads can make their first call at the same moment
+        self._http_lock = threading.Lock()
+        # Pace calls under the configured limits, and back off concurrency on 429s
+        self._limiter = SlidingWindowLimiter(config.requests_per_minute, config.tokens_per_minute)
+        self._concurrency = AIMDController(config.max_concurrency)
+
+        # Async counterpart; httpx async pools are tied to the loop that first used them
+        self._ahttp: AsyncHTTPHandler | None = None
+        self._ahttp_loop: asyncio.AbstractEventLoop | None = None
+
         # Configure LangSmith telemetry if API key is available
         if os.getenv("LANGSMITH_API_KEY"):
             # Enable LiteLLM logging for LangSmith tracing (using modern approach)
@@ -52,17 +107,157 @@ class LLMProvider:
 
         logger.info(f"Initialized LLM provider: {config.provider} with model: {self.model}")
 
+    def _get_http(self) -> HTTPHandler | None:
+        """Return the pooled HTTP client for providers that accept one, creating it on first use"""
+        if self._http is None and self._pooled:
+            with self._http_lock:
+                if self._http is None:
+                    import httpx
+                    from litellm.llms.custom_httpx.http_handler import HTTPHandler
+
+                    self._http = HTTPHandler(client=httpx.Client(
+                        limits=httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS),
+                        timeout=httpx.Timeout(600.0, connect=5.0),
+                        follow_redirects=True
+                    ))
+        return self._http
+
+    def _get_async_http(self) -> AsyncHTTPHandler | None:
+        """Return the pooled async HTTP client for the running event loop, creating it if needed"""
+        if not self._pooled:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._ahttp is None or self._ahttp_loop is not loop:
+            import httpx
+            from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+            self._ahttp = AsyncHTTPHandler(
+                timeout=httpx.Timeout(600.0, connect=5.0),
+                transport=httpx.AsyncHTTPTransport(limits=httpx.Limits(
+                    max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=_MAX_CONNECTIONS
+                ))
+            )
+            self._ahttp_loop = loop
+        return self._ahttp
+
+    def _completion_cache_key(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float,
+        max_tokens: int,
+        kwargs: dict[str, Any]
+    ) -> str | None:
+        """Content-addressed cache key for a completion request, or None if it can't be cached"""
+        return self._prompt_cache.key(self.model, temperature, max_tokens, messages, kwargs)
+
+    def close(self) -> None:
+        """Close the pooled HTTP client"""
+        with self._http_lock:
+            if self._http is not None:
+                # HTTPHandler.close() skips clients passed in to it; close the httpx pool directly
+                self._http.client.close()
+                self._http = None
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client if it belongs to the running event loop"""
+        ahttp, loop = self._ahttp, self._ahttp_loop
+        self._ahttp = None
+        self._ahttp_loop = None
+        if ahttp is not None and loop is asyncio.get_running_loop():
+            await ahttp.client.aclose()
+
+    def _estimate_tokens(self, messages: list[dict[str, Any]], max_tokens: int) -> int:
+        """Rough token cost of a request for the client-side limiter (~4 characters per token)"""
+        prompt_chars = sum(len(str(message.get("content", ""))) for message in messages)
+        return prompt_chars // 4 + max_tokens
+
+    def _observe_rate_limits(self, source: Any) -> None:
+        """Feed rate-limit headers from a LiteLLM response or exception to the limiter"""
+        headers = None
+        hidden_params = getattr(source, "_hidden_params", None)
+        if isinstance(hidden_params, dict):
+            headers = hidden_params.get("additional_headers")
+        if headers is None:
+            headers = getattr(getattr(source, "response", None), "headers", None)
+        if isinstance(headers, Mapping):
+            self._limiter.observe_headers(headers)
+
+    def _get_cached(self, cache_key: str | None) -> str | None:
+        """Return a cached completion for cache_key, if any"""
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Completion served from cache")
+        return cached
+
+    def _extract_content(self, response: Any, cache_key: str | None) -> str:
+        """Validate a LiteLLM response, log its usage, and cache its content"""
+        # Validate response
+        if not response.choices:
+            raise ValueError("API returned empty choices list")
+
+        if response.choices[0].message.content is None:
+            raise ValueError("API returned None content in message")
+
+        # Log usage information
+        if hasattr(response, 'usage') and response.usage:
+            logger.info(
+                f"Completion successful - Tokens used: "
+                f"prompt={response.usage.prompt_tokens}, "
+                f"completion={response.usage.completion_tokens}, "
+                f"total={response.usage.total_tokens}"
+            )
+
+        content = cast(str, response.choices[0].message.content)
+        self._prompt_cache.set(cache_key, content)
+        return content
+
+    def _map_exception(self, e: Exception) -> Exception:
+        """Translate a LiteLLM exception into the ValueError raised to callers
+
+        Returns:
+            The ValueError to raise, or e itself if it is not a LiteLLM API error
+        """
+        errors = _litellm_error_messages()
+        # Walk the MRO so subclasses (e.g. ContextWindowExceededError) map like their base
+        for cls in type(e).__mro__:
+            entry = errors.get(cls)
+            if entry is not None:
+                log_prefix, message = entry
+                logger.error(f"{log_prefix}: {e}")
+                return ValueError(message.format(provider=self.config.provider, error=e))
+        return e
+
     @traceable(name="llm_complete")
     def complete(
         self,
-        messages: List[Dict[str, Any]],
+        messages: list[dict[str, Any]],
         temperature: float = 0.7,
         max_tokens: int = 1024,
         **kwargs: Any
     ) -> str:
         """Generate completion using configured LLM provider"""
-        logger.debug(f"Generating completion with model: {self.model}, temperature: {temperature}, max_tokens: {max_tokens}")
+        logger.debug(
+            f"Generating completion with model: {self.model}, "
+            f"temperature: {temperature}, max_tokens: {max_tokens}"
+        )
+
+        # Identical requests within the cache TTL are answered from the cache
+        cache_key = self._completion_cache_key(messages, temperature, max_tokens, kwargs)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        # litellm takes hundreds of ms to import, so load it on first use rather than
+        # whenever this module is imported
+        from litellm import completion
+
+        http = self._get_http()
+        if http is not None:
+            kwargs.setdefault("client", http)
 
+        self._limiter.acquire_blocking(self._estimate_tokens(messages, max_tokens))
         try:
             response = completion(
                 model=self.model,
@@ -72,54 +267,94 @@ class LLMProvider:
                 api_key=self._api_key,
                 **kwargs
             )
+        except Exception as e:
+            self._observe_rate_limits(e)
+            mapped = self._map_exception(e)
+            if mapped is e:
+                raise
+            raise mapped from e
 
-            # Validate response
-            if not response.choices:
-                raise ValueError("API returned empty choices list")
+        self._observe_rate_limits(response)
+        return self._extract_content(response, cache_key)
 
-            if response.choices[0].message.content is None:
-                raise ValueError("API returned None content in message")
+    @traceable(name="llm_acomplete")
+    async def acomplete(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        **kwargs: Any
+    ) -> str:
+        """Generate completion without blocking the event loop, so calls can overlap"""
+        logger.debug(
+            f"Generating async completion with model: {self.model}, "
+            f"temperature: {temperature}, max_tokens: {max_tokens}"
+        )
+
+        cache_key = self._completion_cache_key(messages, temperature, max_tokens, kwargs)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        from litellm import acompletion
+        from litellm.exceptions import RateLimitError, Timeout
 
-            # Log usage information
-            if hasattr(response, 'usage') and response.usage:
-                logger.info(
-                    f"Completion successful - Tokens used: "
-                    f"prompt={response.usage.prompt_tokens}, "
-                    f"completion={response.usage.completion_tokens}, "
-                    f"total={response.usage.total_tokens}"
+        ahttp = self._get_async_http()
+        if ahttp is not None:
+            kwargs.setdefault("client", ahttp)
+
+        await self._limiter.acquire(self._estimate_tokens(messages, max_tokens))
+        async with self._concurrency.slot():
+            try:
+                response = await acompletion(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    api_key=self._api_key,
+                    **kwargs
                 )
+            except Exception as e:
+                if isinstance(e, (RateLimitError, Timeout)):
+                    self._concurrency.on_throttle()
+                self._observe_rate_limits(e)
+                mapped = self._map_exception(e)
+                if mapped is e:
+                    raise
+                raise mapped from e
+            self._concurrency.on_success()
 
-            return response.choices[0].message.content
+        self._observe_rate_limits(response)
+        return self._extract_content(response, cache_key)
 
-        except AuthenticationError as e:
-            logger.error(f"Authentication failed: {e}")
-            raise ValueError(
-                f"Authentication failed. Please check your API key for {self.config.provider}"
-            ) from e
-        except RateLimitError as e:
-            logger.error(f"Rate limit exceeded: {e}")
-            raise ValueError(
-                f"Rate limit exceeded for {self.config.provider}. Please try again later."
-            ) from e
-        except Timeout as e:
-            logger.error(f"Request timeout: {e}")
-            raise ValueError(
-                f"Request to {self.config.provider} timed out. Please try again."
-            ) from e
-        except BadRequestError as e:
-            logger.error(f"Bad request: {e}")
-            raise ValueError(
-                f"Invalid request to {self.config.provider}: {str(e)}"
-            ) from e
-        except APIError as e:
-            logger.error(f"API error: {e}")
-            raise ValueError(
-                f"API error from {self.config.provider}: {str(e)}"
-            ) from e
+    async def acomplete_many(
+        self,
+        messages_list: list[list[dict[str, Any]]],
+        max_concurrency: int | None = None,
+        **kwargs: Any
+    ) -> list[str | BaseException]:
+        """Run several completions concurrently, with a bounded number in flight
+
+        Args:
+            messages_list: One message list per completion
+            max_concurrency: Cap on calls in flight (default: llm.max_concurrency)
+            **kwargs: Passed through to acomplete for every call
+
+        Returns:
+            Completion text per request, in order, or the exception that request raised
+        """
+        # Unbounded fan-out just queues requests inside the HTTP pool; waiting here is cheaper
+        semaphore = asyncio.Semaphore(max_concurrency or self.config.max_concurrency)
+
+        async def one(messages: list[dict[str, Any]]) -> str:
+            async with semaphore:
+                return await self.acomplete(messages, **kwargs)
+
+        return await asyncio.gather(*(one(m) for m in messages_list), return_exceptions=True)
 
     def complete_json(
         self,
-        messages: List[Dict[str, Any]],
+        messages: list[dict[str, Any]],
         temperature: float = 0.7,
         max_tokens: int = 2048,
         **kwargs: Any
@@ -133,3 +368,20 @@ class LLMProvider:
             response_format={"type": "json_object"},
             **kwargs
         )
+
+    async def acomplete_json(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        **kwargs: Any
+    ) -> str:
+        """Generate JSON completion without blocking the event loop"""
+        logger.debug("Generating async JSON completion")
+        return await self.acomplete(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+            **kwargs
+        )
@@ -0,0 +1,174 @@
+import asyncio
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+# Length of the sliding window provider limits are expressed over
+WINDOW_SECONDS = 60.0
+
+# Pause used when a provider reports an exhausted limit without a parseable reset time
+_DEFAULT_RESET_SECONDS = 1.0
+
+# Durations as OpenAI-style reset headers write them, e.g. "1s", "6m0s", "20ms"
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+# (remaining, reset) header pairs, OpenAI-compatible and Anthropic naming
+_LIMIT_HEADERS = (
+    ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+    ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-reset"),
+    ("anthropic-ratelimit-tokens-remaining", "anthropic-ratelimit-tokens-reset"),
+)
+
+
+def _parse_reset(value: str) -> float | None:
+    """Seconds until a limit resets, from a duration ("6m0s") or an RFC 3339 timestamp"""
+    value = value.strip()
+    parts = _DURATION_PART_RE.findall(value)
+    if parts and "".join(n + unit for n, unit in parts) == value:
+        return sum(float(n) * _DURATION_UNITS[unit] for n, unit in parts)
+
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return max(reset_at.timestamp() - time.time(), 0.0)
+
+
+class SlidingWindowLimiter:
+    """Client-side requests/tokens per minute limit, so calls wait instead of hitting 429s"""
+
+    def __init__(
+        self,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (timestamp, tokens) for every request admitted within the window
+        self._requests: deque[tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+        # Set when the provider reports an exhausted limit
+        self._blocked_until = 0.0
+
+    def _reserve(self, tokens: int) -> float:
+        """Admit a request of tokens now and return 0, or return how long to wait first"""
+        if self.tpm is not None:
+            # A request larger than the whole budget is charged the full budget: it waits for
+            # the window to drain, then runs alone within it
+            tokens = min(tokens, self.tpm)
+
+        with self._lock:
+            now = self._clock()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+
+            cutoff = now - WINDOW_SECONDS
+            while self._requests and self._requests[0][0] <= cutoff:
+                self._tokens_in_window -= self._requests.popleft()[1]
+
+            wait = 0.0
+            if self.rpm is not None and len(self._requests) >= self.rpm:
+                wait = self._requests[0][0] - cutoff
+            if (
+                self.tpm is not None
+                and self._requests
+                and self._tokens_in_window + tokens > self.tpm
+            ):
+                # Wait until enough of the oldest requests have left the window
+                excess = self._tokens_in_window + tokens - self.tpm
+                for timestamp, used in self._requests:
+                    excess -= used
+                    if excess <= 0:
+                        wait = max(wait, timestamp - cutoff)
+                        break
+            if wait > 0:
+                return wait
+
+            self._requests.append((now, tokens))
+            self._tokens_in_window += tokens
+            return 0.0
+
+    def acquire_blocking(self, tokens: int = 0) -> None:
+        """Block the calling thread until a request of tokens fits within the limits"""
+        while (wait := self._reserve(tokens)) > 0:
+            time.sleep(wait)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait without blocking the event loop until a request of tokens fits within the limits"""
+        while (wait := self._reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def observe_headers(self, headers: Mapping[str, str]) -> None:
+        """Pause new requests until reset when response headers report an exhausted limit"""
+        lowered = {
+            key.lower().removeprefix("llm_provider-"): value for key, value in headers.items()
+        }
+        for remaining_key, reset_key in _LIMIT_HEADERS:
+            remaining = lowered.get(remaining_key)
+            if remaining is None:
+                continue
+            try:
+                if int(float(remaining)) > 0:
+                    continue
+            except ValueError:
+                continue
+
+            reset = lowered.get(reset_key)
+            delay = _parse_reset(reset) if reset is not None else None
+            with self._lock:
+                self._blocked_until = max(
+                    self._blocked_until,
+                    self._clock() + (delay if delay is not None else _DEFAULT_RESET_SECONDS)
+                )
+
+
+class AIMDController:
+    """Additive-increase/multiplicative-decrease cap on concurrent async LLM calls"""
+
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.limit = float(max_concurrency)
+        self._in_flight = 0
+        self._condition: asyncio.Condition | None = None
+        self._condition_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Return the wait condition for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._condition_loop is not loop:
+            self._condition = asyncio.Condition()
+            self._condition_loop = loop
+            self._in_flight = 0
+        return self._condition
+
+    def on_success(self) -> None:
+        """Grow the cap by half a slot after a successful call"""
+        self.limit = min(self.limit + 0.5, float(self.max_concurrency))
+
+    def on_throttle(self) -> None:
+        """Halve the cap after a rate limit or timeout"""
+        self.limit = max(self.limit * 0.5, float(self.min_concurrency))
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the currently allowed concurrent call slots"""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self._in_flight -= 1
+                condition.notify_all()
@@ -0,0 +1,56 @@
+import asyncio
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
+    from news_agent.mcp.github_client import GitHubMCPClient, GitHubRepo
+    from news_agent.mcp.hn_client import HackerNewsMCPClient, HNStory
+
+__all__ = ["GitHubMCPClient", "GitHubRepo", "HackerNewsMCPClient", "HNStory"]
+
+# Public name -> submodule; imported on first access so `import news_agent.mcp` stays cheap
+_LAZY_ATTRS = {
+    "GitHubMCPClient": "github_client",
+    "GitHubRepo": "github_client",
+    "HackerNewsMCPClient": "hn_client",
+    "HNStory": "hn_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{_LAZY_ATTRS[name]}"), name)
+
+
+# One pooled HTTP/2 client shared by the GitHub and HN clients. An AsyncClient is bound
+# to the event loop it first ran on, so it is recreated when used from a new loop.
+_client: "httpx.AsyncClient | None" = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_client() -> "httpx.AsyncClient":
+    """Return the shared HTTP client for the running event loop, creating it if needed"""
+    global _client, _client_loop
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=30.0
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client, if one is open on the running loop"""
+    global _client, _client_loop
+    client, loop = _client, _client_loop
+    _client = _client_loop = None
+    # A client from a finished loop cannot be closed here; just drop it
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
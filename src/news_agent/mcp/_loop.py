@@ -0,0 +1,35 @@
+import asyncio
+import atexit
+from collections.abc import Coroutine
+from typing import TypeVar
+from news_agent.mcp import aclose_client
+
+T = TypeVar('T')
+
+# Event loop reused by the sync client wrappers, so back-to-back calls keep the shared
+# HTTP client and its connections instead of rebuilding them per call. Not thread-safe:
+# the sync wrappers are meant to be called from one thread.
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the persistent event loop, creating it on first use"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+
+def run_sync(coro: Coroutine[object, object, T]) -> T:
+    """Run coro to completion on the persistent event loop"""
+    return get_loop().run_until_complete(coro)
+
+
+@atexit.register
+def close_loop() -> None:
+    """Close the shared HTTP client and the persistent loop"""
+    global _loop
+    if _loop is not None and not _loop.is_closed():
+        _loop.run_until_complete(aclose_client())
+        _loop.close()
+    _loop = None
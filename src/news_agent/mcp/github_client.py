@@ -1,14 +1,29 @@
-import asyncio
+from __future__ import annotations
+
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, TypedDict
 from news_agent.config.models import GitHubSourceConfig
+from news_agent.mcp import aclose_client, get_client
+from news_agent.mcp._loop import run_sync
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+class GitHubRepo(TypedDict):
+    """Shape of a repository returned by the client (plain dict, no per-item validation)"""
+    name: str
+    url: str
+    description: str
+    stars: int
+    forks: int
+    language: str
+    stars_today: int
+
+
 class GitHubMCPClient:
     """Client for interacting with GitHub via MCP or direct API"""
 
@@ -18,7 +33,21 @@ class GitHubMCPClient:
         if not self.github_token:
             logger.warning("No GITHUB_PAT or GITHUB_TOKEN found - API calls may be rate limited")
 
-    def fetch_trending_repositories(self, time_range: str = "daily") -> list[dict[str, Any]]:
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the HTTP client shared across MCP clients"""
+        return get_client()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        await aclose_client()
+
+    async def __aenter__(self) -> "GitHubMCPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def fetch_trending_repositories(self, time_range: str = "daily") -> list[GitHubRepo]:
         """Fetch trending repositories from GitHub
 
         Args:
@@ -34,9 +63,15 @@ class GitHubMCPClient:
             - language: Primary language
             - stars_today: Stars gained today
         """
-        return asyncio.run(self._fetch_trending_repos_async(time_range))
+        return run_sync(self._fetch_trending_repos_async(time_range))
+
+    async def fetch_trending_repositories_async(
+        self, time_range: str = "daily"
+    ) -> list[GitHubRepo]:
+        """Async variant of fetch_trending_repositories"""
+        return await self._fetch_trending_repos_async(time_range)
 
-    async def _fetch_trending_repos_async(self, time_range: str) -> list[dict[str, Any]]:
+    async def _fetch_trending_repos_async(self, time_range: str) -> list[GitHubRepo]:
         """Async implementation to fetch trending repos"""
         try:
             # Calculate date range for pushed activity (more accurate for trending)
@@ -60,37 +95,38 @@ class GitHubMCPClient:
             if self.github_token:
                 headers["Authorization"] = f"Bearer {self.github_token}"
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://api.github.com/search/repositories",
-                    params={
-                        "q": f"pushed:>{since_date} stars:>{stars_threshold}",
-                        "sort": "stars",
-                        "order": "desc",
-                        "per_page": 25
-                    },
-                    headers=headers,
-                    timeout=30.0
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    repos = []
-                    for item in data.get("items", [])[:25]:
-                        repos.append({
-                            "name": item.get("full_name", ""),
-                            "url": item.get("html_url", ""),
-                            "description": item.get("description", "") or "No description",
-                            "stars": item.get("stargazers_count", 0),
-                            "forks": item.get("forks_count", 0),
-                            "language": item.get("language", "") or "Unknown",
-                            "stars_today": 0  # GitHub API doesn't provide daily star delta
-                        })
-                    logger.info(f"Found {len(repos)} trending repositories")
-                    return repos
-                else:
-                    logger.error(f"GitHub API error: {response.status_code} - {response.text}")
-                    return []
+            client = self._get_http()
+            response = await client.get(
+                "https://api.github.com/search/repositories",
+                params={
+                    "q": f"pushed:>{since_date} stars:>{stars_threshold}",
+                    "sort": "stars",
+                    "order": "desc",
+                    "per_page": 25
+                },
+                headers=headers
+            )
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                repos: list[GitHubRepo] = []
+                for item in data.get("items", [])[:25]:
+                    repos.append({
+                        "name": item.get("full_name", ""),
+                        "url": item.get("html_url", ""),
+                        "description": item.get("description", "") or "No description",
+                        "stars": item.get("stargazers_count", 0),
+                        "forks": item.get("forks_count", 0),
+                        "language": item.get("language", "") or "Unknown",
+                        "stars_today": 0  # GitHub API doesn't provide daily star delta
+                    })
+                logger.info(f"Found {len(repos)} trending repositories")
+                return repos
+            else:
+                # Error pages can be large; only decode as much of the body as we log
+                body = response.content[:512].decode('utf-8', 'replace')
+                logger.error("GitHub API error: %s - %s", response.status_code, body)
+                return []
 
         except Exception as e:
             logger.error(f"Error fetching trending repos: {e}")
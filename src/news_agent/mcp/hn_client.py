@@ -1,24 +1,80 @@
+from __future__ import annotations
+
 import asyncio
 import logging
-from typing import Any, Literal
+import re
+from typing import Any, Literal, NotRequired, TypedDict
+from news_agent.cache.manager import CacheManager
 from news_agent.config.models import HackerNewsSourceConfig
+from news_agent.mcp import aclose_client, get_client
+from news_agent.mcp._loop import run_sync
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on in-flight item requests across all endpoints
+ITEM_FETCH_CONCURRENCY = 16
+
+
+class HNStory(TypedDict):
+    """Shape of a story returned by the client (plain dict, no per-item validation)"""
+    id: int
+    title: str
+    url: str
+    score: int
+    by: str
+    time: int
+    descendants: int
+    text: str
+    relevance_score: NotRequired[float]
+
 
 class HackerNewsMCPClient:
     """Client for interacting with Hacker News API"""
 
-    def __init__(self, config: HackerNewsSourceConfig):
+    def __init__(self, config: HackerNewsSourceConfig, cache: CacheManager | None = None):
         self.config = config
+        self.cache = cache
         self.base_url = "https://hacker-news.firebaseio.com/v0"
+        self._semaphore: asyncio.Semaphore | None = None
+        # All topics in one alternation, so each story is scanned once rather than per topic
+        self._topic_pattern = (
+            re.compile(
+                "|".join(re.escape(t) for t in sorted(config.filter_topics, key=len, reverse=True)),
+                re.IGNORECASE
+            )
+            if config.filter_topics else None
+        )
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the HTTP client shared across MCP clients"""
+        return get_client()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the item-fetch semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(ITEM_FETCH_CONCURRENCY)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        await aclose_client()
+
+    async def __aenter__(self) -> "HackerNewsMCPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     def fetch_posts(
         self,
         endpoint: Literal["newest", "show", "ask", "job"],
         limit: int = 30
-    ) -> list[dict[str, Any]]:
+    ) -> list[HNStory]:
         """Fetch posts from Hacker News
 
         Args:
@@ -35,9 +91,13 @@ class HackerNewsMCPClient:
             - time: Unix timestamp
             - descendants: Comment count
         """
-        return asyncio.run(self._fetch_posts_async(endpoint, limit))
+        return run_sync(self._fetch_posts_async(endpoint, limit))
 
-    async def _fetch_posts_async(self, endpoint: str, limit: int) -> list[dict[str, Any]]:
+    async def fetch_posts_async(self, endpoint: str, limit: int = 30) -> list[HNStory]:
+        """Async variant of fetch_posts, for fetching several endpoints concurrently"""
+        return await self._fetch_posts_async(endpoint, limit)
+
+    async def _fetch_posts_async(self, endpoint: str, limit: int) -> list[HNStory]:
         """Async implementation to fetch HN posts"""
         try:
             # Map endpoint names to HN API endpoints
@@ -51,51 +111,75 @@ class HackerNewsMCPClient:
 
             logger.info(f"Fetching {endpoint} stories from Hacker News (limit: {limit})")
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Step 1: Get list of story IDs
-                response = await client.get(f"{self.base_url}/{api_endpoint}.json")
-
-                if response.status_code != 200:
-                    logger.error(f"HN API error: {response.status_code}")
-                    return []
-
-                story_ids = response.json()[:limit]  # Limit to requested count
+            client = self._get_http()
 
-                # Step 2: Fetch details for each story in parallel
-                tasks = [
-                    self._fetch_item_details(client, story_id)
-                    for story_id in story_ids
-                ]
-                stories = await asyncio.gather(*tasks)
+            # Step 1: Get list of story IDs
+            response = await client.get(f"{self.base_url}/{api_endpoint}.json")
 
-                # Step 3: Filter out None values and apply topic filtering
-                valid_stories = [s for s in stories if s is not None]
-
-                # Apply topic filtering if configured
-                if self.config.filter_topics:
-                    filtered_stories = self._filter_by_topics(valid_stories)
-                    logger.info(
-                        f"Filtered {len(valid_stories)} stories to {len(filtered_stories)} "
-                        f"matching topics: {self.config.filter_topics}"
-                    )
-                    return filtered_stories
-
-                logger.info(f"Fetched {len(valid_stories)} stories from HN")
-                return valid_stories
+            if response.status_code != 200:
+                logger.error(f"HN API error: {response.status_code}")
+                return []
+
+            story_ids = orjson.loads(response.content)[:limit]  # Limit to requested count
+
+            # Step 2: Reuse story details cached by earlier runs, fetch the rest in parallel
+            # SQLite lookups and writes block, so keep them off the event loop
+            stories_by_id = await asyncio.to_thread(self._get_cached_items, story_ids)
+            missing_ids = [story_id for story_id in story_ids if story_id not in stories_by_id]
+            fetched = await asyncio.gather(*[
+                self._fetch_item_details(client, story_id)
+                for story_id in missing_ids
+            ])
+            stories_by_id.update(zip(missing_ids, fetched))
+            if self.cache is not None:
+                await asyncio.to_thread(self.cache.set_items, {
+                    f"hn_item:{story['id']}": story for story in fetched if story is not None
+                })
+            stories = [stories_by_id[story_id] for story_id in story_ids]
+
+            # Step 3: Filter out None values and apply topic filtering
+            valid_stories = [s for s in stories if s is not None]
+
+            # Apply topic filtering if configured
+            if self.config.filter_topics:
+                filtered_stories = self._filter_by_topics(valid_stories)
+                logger.info(
+                    f"Filtered {len(valid_stories)} stories to {len(filtered_stories)} "
+                    f"matching topics: {self.config.filter_topics}"
+                )
+                return filtered_stories
+
+            logger.info(f"Fetched {len(valid_stories)} stories from HN")
+            return valid_stories
 
         except Exception as e:
             logger.error(f"Error fetching HN posts: {e}")
             return []
 
-    async def _fetch_item_details(self, client: httpx.AsyncClient, item_id: int) -> dict[str, Any] | None:
+    def _get_cached_items(self, item_ids: list[int]) -> dict[int, HNStory | None]:
+        """Look up stories cached within the source TTL, so scores stay as fresh as post lists"""
+        if self.cache is None:
+            return {}
+
+        cached = self.cache.get_items(
+            [f"hn_item:{item_id}" for item_id in item_ids], ttl_hours=self.cache.config.ttl_hours
+        )
+        return {
+            item_id: cached[key]
+            for item_id in item_ids
+            if (key := f"hn_item:{item_id}") in cached
+        }
+
+    async def _fetch_item_details(self, client: httpx.AsyncClient, item_id: int) -> HNStory | None:
         """Fetch details for a single HN item"""
         try:
-            response = await client.get(f"{self.base_url}/item/{item_id}.json")
+            async with self._get_semaphore():
+                response = await client.get(f"{self.base_url}/item/{item_id}.json")
 
             if response.status_code != 200:
                 return None
 
-            item = response.json()
+            item = orjson.loads(response.content)
 
             # Skip if not a story or if deleted/dead
             if not item or item.get("type") != "story" or item.get("deleted") or item.get("dead"):
@@ -116,23 +200,18 @@ class HackerNewsMCPClient:
             logger.debug(f"Error fetching item {item_id}: {e}")
             return None
 
-    def _filter_by_topics(self, stories: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _filter_by_topics(self, stories: list[HNStory]) -> list[HNStory]:
         """Filter stories by configured topics"""
-        if not self.config.filter_topics:
+        if self._topic_pattern is None:
             return stories
 
-        filtered = []
-        topics_lower = [t.lower() for t in self.config.filter_topics]
-
-        for story in stories:
-            title_lower = story.get("title", "").lower()
-            text_lower = story.get("text", "").lower()
-
-            # Check if any topic appears in title or text
-            if any(topic in title_lower or topic in text_lower for topic in topics_lower):
-                filtered.append(story)
-
-        return filtered
+        # Check if any topic appears in title or text; the separator keeps matches from
+        # spanning the two fields
+        search = self._topic_pattern.search
+        return [
+            story for story in stories
+            if search(f"{story.get('title', '')}\x00{story.get('text', '')}")
+        ]
 
     def fetch_comments(self, post_id: int) -> list[dict[str, Any]]:
         """Fetch comments for a post
@@ -1,10 +1,77 @@
+import io
 from datetime import datetime
+from collections.abc import Callable
 from typing import Any
+from news_agent.utils.formatting import format_count
+
+SECTION_SEPARATOR = "\n\n---\n\n"
+
+
+def _format_timestamp(now: datetime) -> str:
+    """Format as YYYY-MM-DD HH:MM AM/PM without going through strftime's locale handling"""
+    return (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d} "
+        f"{(now.hour - 1) % 12 + 1:02d}:{now.minute:02d} {'AM' if now.hour < 12 else 'PM'}"
+    )
+
+
+def _format_repo(idx: int, repo: dict[str, Any]) -> str:
+    """Render one repository as a complete markdown block"""
+    # Look each field up once
+    get = repo.get
+    language = get('language')
+    stars_today = get('stars_today')
+    analysis = get('analysis')
+
+    # Stats line
+    stats = f"⭐ {format_count(get('stars', 0))} stars | 🔱 {format_count(get('forks', 0))} forks"
+
+    if language:
+        stats += f" | 💻 {language}"
+
+    if stars_today:
+        stats += f" | 📈 +{stars_today} stars today"
+
+    # Analysis
+    analysis_block = f"\n**Analysis:** {analysis}" if analysis else ""
+
+    return (
+        f"\n\n### {idx}. [{repo['name']}]({repo['url']})"
+        f"\n**Description:** {get('description', 'N/A')}"
+        f"\n**Stats:** {stats}"
+        f"{analysis_block}"
+    )
+
+
+def _format_post(idx: int, post: dict[str, Any]) -> str:
+    """Render one HN post as a complete markdown block"""
+    link = post.get('url')
+    link_block = f"\n**Link:** {link}" if link else ""
+
+    # Summary
+    summary = post.get('summary')
+    summary_block = f"\n**Summary:** {summary}" if summary else ""
+
+    # Discussion highlights
+    discussion = post.get('discussion')
+    discussion_block = f"\n**Discussion Highlights:** {discussion}" if discussion else ""
+
+    return (
+        f"\n\n### {idx}. [{post['title']}]({post.get('hn_url', '#')})"
+        f"{link_block}"
+        f"\n**Stats:** {post.get('score', 0)} points | {post.get('comments_count', 0)} comments"
+        f"{summary_block}"
+        f"{discussion_block}"
+    )
 
 
 class MarkdownGenerator:
     """Generate markdown reports from collected data"""
 
+    def __init__(self, clock: Callable[[], datetime] = datetime.now):
+        # Source of the generation time; tests and batch runs can pass a fixed clock
+        self._clock = clock
+
     def generate_report(self, data: dict[str, Any]) -> str:
         """Generate complete markdown report
 
@@ -17,105 +84,76 @@ class MarkdownGenerator:
         Returns:
             Formatted markdown string
         """
-        sections = []
+        # Every section writes into one buffer, with separators written inline
+        buf = io.StringIO()
 
         # Header
-        sections.append(self._generate_header(data.get("metadata", {})))
+        self._write_header(buf, data.get("metadata", {}))
 
         # GitHub section
         if data.get("github_repos"):
-            sections.append(self.generate_github_section(data["github_repos"]))
+            buf.write(SECTION_SEPARATOR)
+            self._write_github_section(buf, data["github_repos"])
 
         # Hacker News section
         if data.get("hn_posts"):
-            sections.append(self.generate_hn_section(data["hn_posts"]))
+            buf.write(SECTION_SEPARATOR)
+            self._write_hn_section(buf, data["hn_posts"])
 
         # Summary
-        sections.append(self._generate_summary(data))
+        buf.write(SECTION_SEPARATOR)
+        self._write_summary(buf, data)
 
-        return "\n\n---\n\n".join(sections)
+        return buf.getvalue()
 
-    def _generate_header(self, metadata: dict[str, Any]) -> str:
-        """Generate report header"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %I:%M %p")
+    def _write_header(self, buf: io.StringIO, metadata: dict[str, Any]) -> None:
+        """Write report header"""
+        timestamp = _format_timestamp(self._clock())
 
-        return f"""# News Agent Report
+        buf.write(f"""# News Agent Report
 
 **Generated:** {timestamp}
 **Analysis Depth:** {metadata.get('analysis_depth', 'medium')}
-**Sources:** {', '.join(metadata.get('sources', []))}"""
+**Sources:** {', '.join(metadata.get('sources', []))}""")
 
     def generate_github_section(self, repos: list[dict[str, Any]]) -> str:
         """Generate GitHub trending repositories section"""
-        lines = [f"## GitHub Trending Repositories (Top {len(repos)})"]
-
-        for i, repo in enumerate(repos, 1):
-            lines.append(f"\n### {i}. [{repo['name']}]({repo['url']})")
-            lines.append(f"**Description:** {repo.get('description', 'N/A')}")
-
-            # Stats line
-            stats = [
-                f"⭐ {repo.get('stars', 0):,} stars",
-                f"🔱 {repo.get('forks', 0):,} forks"
-            ]
-
-            if repo.get('language'):
-                stats.append(f"💻 {repo['language']}")
-
-            if repo.get('stars_today'):
-                stats.append(f"📈 +{repo['stars_today']} stars today")
+        buf = io.StringIO()
+        self._write_github_section(buf, repos)
+        return buf.getvalue()
 
-            lines.append(f"**Stats:** {' | '.join(stats)}")
+    def _write_github_section(self, buf: io.StringIO, repos: list[dict[str, Any]]) -> None:
+        """Write GitHub trending repositories section"""
+        buf.write(f"## GitHub Trending Repositories (Top {len(repos)})")
 
-            # Analysis
-            if repo.get('analysis'):
-                lines.append(f"**Analysis:** {repo['analysis']}")
-
-        return "\n".join(lines)
+        buf.write("".join([_format_repo(i, repo) for i, repo in enumerate(repos, 1)]))
 
     def generate_hn_section(self, posts: list[dict[str, Any]]) -> str:
         """Generate Hacker News section"""
-        lines = [f"## Hacker News - AI/ML/GenAI Topics (Top {len(posts)})"]
-
-        for i, post in enumerate(posts, 1):
-            lines.append(f"\n### {i}. [{post['title']}]({post.get('hn_url', '#')})")
-
-            if post.get('url'):
-                lines.append(f"**Link:** {post['url']}")
+        buf = io.StringIO()
+        self._write_hn_section(buf, posts)
+        return buf.getvalue()
 
-            # Stats
-            stats = [
-                f"{post.get('score', 0)} points",
-                f"{post.get('comments_count', 0)} comments"
-            ]
-            lines.append(f"**Stats:** {' | '.join(stats)}")
+    def _write_hn_section(self, buf: io.StringIO, posts: list[dict[str, Any]]) -> None:
+        """Write Hacker News section"""
+        buf.write(f"## Hacker News - AI/ML/GenAI Topics (Top {len(posts)})")
 
-            # Summary
-            if post.get('summary'):
-                lines.append(f"**Summary:** {post['summary']}")
+        buf.write("".join([_format_post(i, post) for i, post in enumerate(posts, 1)]))
 
-            # Discussion highlights
-            if post.get('discussion'):
-                lines.append(f"**Discussion Highlights:** {post['discussion']}")
-
-        return "\n".join(lines)
-
-    def _generate_summary(self, data: dict[str, Any]) -> str:
-        """Generate report summary"""
-        lines = ["## Summary"]
+    def _write_summary(self, buf: io.StringIO, data: dict[str, Any]) -> None:
+        """Write report summary"""
+        buf.write("## Summary")
 
         github_count = len(data.get("github_repos", []))
         hn_count = len(data.get("hn_posts", []))
 
         if github_count:
-            lines.append(f"- **GitHub:** {github_count} trending repositories analyzed")
+            buf.write(f"\n- **GitHub:** {github_count} trending repositories analyzed")
 
         if hn_count:
-            lines.append(f"- **Hacker News:** {hn_count} AI/ML topics curated")
+            buf.write(f"\n- **Hacker News:** {hn_count} AI/ML topics curated")
 
         metadata = data.get("metadata", {})
         if metadata.get("sources"):
             sources_str = ", ".join(metadata["sources"])
-            lines.append(f"- **Sources:** {sources_str}")
-
-        return "\n".join(lines)
+            buf.write(f"\n- **Sources:** {sources_str}")
@@ -1,15 +1,36 @@
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from itertools import islice
 from typing import Any
-from rich.console import Console
+from rich.console import Console, Group
+from rich.highlighter import NullHighlighter
+from rich.logging import RichHandler
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
+from news_agent.utils.formatting import format_count
+
+# Console probes the terminal when constructed, so every display shares one
+_CONSOLE = Console()
+
+# Status message markers: (rich markup, plain text) per message kind
+_STATUS_PREFIXES = {
+    "progress": ("[blue]⏳[/blue]", "⏳"),
+    "success": ("[green]✓[/green]", "✓"),
+    "error": ("[red]✗[/red]", "✗"),
+    "warning": ("[yellow]⚠[/yellow]", "⚠"),
+}
 
 
 class TerminalDisplay:
     """Handle rich terminal output"""
 
-    def __init__(self):
-        self.console = Console()
+    def __init__(self, console: Console | None = None):
+        self.console = console or _CONSOLE
+        # Without a terminal there is nothing to style, so status lines skip rich rendering
+        self._plain = not self.console.is_terminal
 
     def show_github_preview(self, repos: list[dict[str, Any]], limit: int = 10) -> None:
         """Display GitHub repos preview in terminal"""
@@ -19,15 +40,18 @@ class TerminalDisplay:
         table.add_column("Repository", style="magenta")
         table.add_column("Stars", style="green", justify="right")
         table.add_column("Forks", style="yellow", justify="right")
-        table.add_column("Description", style="white")
+        # rich truncates long cells at render time
+        table.add_column(
+            "Description", style="white", max_width=63, overflow="ellipsis", no_wrap=True
+        )
 
-        for i, repo in enumerate(repos[:limit], 1):
+        for i, repo in enumerate(islice(repos, limit), 1):
             table.add_row(
                 str(i),
                 repo.get("name", "N/A"),
-                f"{repo.get('stars', 0):,}",
-                f"{repo.get('forks', 0):,}",
-                repo.get("description", "")[:60] + "..." if len(repo.get("description", "")) > 60 else repo.get("description", "")
+                format_count(repo.get('stars', 0)),
+                format_count(repo.get('forks', 0)),
+                repo.get("description", "")
             )
 
         self.console.print(table)
@@ -37,14 +61,14 @@ class TerminalDisplay:
         table = Table(title="Hacker News - AI/ML/GenAI Topics", show_header=True)
 
         table.add_column("Rank", style="cyan", width=6)
-        table.add_column("Title", style="magenta")
+        table.add_column("Title", style="magenta", max_width=63, overflow="ellipsis", no_wrap=True)
         table.add_column("Score", style="green", justify="right")
         table.add_column("Comments", style="yellow", justify="right")
 
-        for i, post in enumerate(posts[:limit], 1):
+        for i, post in enumerate(islice(posts, limit), 1):
             table.add_row(
                 str(i),
-                post.get("title", "N/A")[:60] + "..." if len(post.get("title", "")) > 60 else post.get("title", ""),
+                post.get("title", "N/A"),
                 str(post.get("score", 0)),
                 str(post.get("comments_count", 0))
             )
@@ -65,16 +89,69 @@ class TerminalDisplay:
 
     def show_progress(self, message: str) -> None:
         """Show progress message"""
-        self.console.print(f"[blue]⏳[/blue] {message}")
+        self.batch_messages([("progress", message)])
 
     def show_success(self, message: str) -> None:
         """Show success message"""
-        self.console.print(f"[green]✓[/green] {message}")
+        self.batch_messages([("success", message)])
 
     def show_error(self, message: str) -> None:
         """Show error message"""
-        self.console.print(f"[red]✗[/red] {message}")
+        self.batch_messages([("error", message)])
 
     def show_warning(self, message: str) -> None:
         """Show warning message"""
-        self.console.print(f"[yellow]⚠[/yellow] {message}")
+        self.batch_messages([("warning", message)])
+
+    def logging_handler(self) -> logging.Handler:
+        """Log handler that keeps log lines from garbling the live status spinner
+
+        Returns:
+            A handler printing through this display's console on a terminal, so log lines
+            scroll above the spinner; a plain stderr handler otherwise
+        """
+        if self._plain:
+            return logging.StreamHandler()
+        # Only the formatted message is shown, so output matches a plain StreamHandler
+        return RichHandler(
+            console=self.console,
+            show_time=False,
+            show_level=False,
+            show_path=False,
+            markup=False,
+            highlighter=NullHighlighter()
+        )
+
+    @contextmanager
+    def status(self, message: str) -> Iterator[None]:
+        """Show a progress message with a live spinner while the block runs
+
+        Args:
+            message: Progress message shown until the block exits
+        """
+        if self._plain:
+            self.batch_messages([("progress", message)])
+            yield
+            return
+
+        # One Live region redrawn at most 10 times a second; log lines go through the same
+        # console (see logging_handler) and scroll above it
+        with self.console.status(message, refresh_per_second=10):
+            yield
+
+    def batch_messages(self, messages: list[tuple[str, str]]) -> None:
+        """Show several status messages with a single write
+
+        Args:
+            messages: (kind, message) pairs, kind being progress, success, error or warning
+        """
+        if self._plain:
+            self.console.file.write("".join(
+                f"{_STATUS_PREFIXES[kind][1]} {message}\n" for kind, message in messages
+            ))
+            return
+
+        self.console.print(Group(*[
+            Text.from_markup(f"{_STATUS_PREFIXES[kind][0]} ").append(message)
+            for kind, message in messages
+        ]))
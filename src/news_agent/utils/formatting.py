@@ -0,0 +1,3 @@
+def format_count(n: int) -> str:
+    """Format a count with thousands separators, skipping the grouping pass when there are none"""
+    return str(n) if -1000 < n < 1000 else f"{n:,}"
@@ -0,0 +1,48 @@
+import json
+import re
+from typing import Any
+import orjson
+
+# LLM replies sometimes wrap JSON in a markdown code block
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*\n?(.*?)\n?```', re.DOTALL)
+_DECODER = json.JSONDecoder()
+
+
+def extract_json_object(text: str) -> dict[str, Any] | None:
+    """Extract a JSON object from an LLM reply, tolerating code fences and extra text
+
+    Args:
+        text: Raw completion text
+
+    Returns:
+        The parsed object, or None if the text holds no JSON object
+    """
+    # Try to parse as-is first; a JSON list or bare number falls through to the fallbacks
+    try:
+        result = orjson.loads(text)
+        if isinstance(result, dict):
+            return result
+    except orjson.JSONDecodeError:
+        pass
+
+    # Parse the first JSON object in the text, ignoring anything after it
+    start = text.find('{')
+    if start != -1:
+        try:
+            result = _DECODER.raw_decode(text, start)[0]
+            if isinstance(result, dict):
+                return result
+        except json.JSONDecodeError:
+            pass
+
+    # Try to extract from markdown code block
+    json_match = _CODE_BLOCK_RE.search(text)
+    if json_match:
+        try:
+            result = orjson.loads(json_match.group(1))
+            if isinstance(result, dict):
+                return result
+        except orjson.JSONDecodeError:
+            pass
+
+    return None
@@ -1,36 +1,96 @@
+import asyncio
+import functools
+import random
 import time
-from typing import TypeVar, Callable
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 from news_agent.config.models import RetryConfig
 
 T = TypeVar('T')
 
 
+@functools.cache
+def _backoff_delays(backoff_multiplier: int, max_attempts: int) -> tuple[int, ...]:
+    """Base delay before each retry, computed once per retry policy"""
+    return tuple(backoff_multiplier ** attempt for attempt in range(max_attempts - 1))
+
+
+def with_retry(
+    config: RetryConfig,
+    retryable_exceptions: tuple[type[BaseException], ...] = (ConnectionError, TimeoutError)
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator applying exponential backoff retry logic to every call of a function
+
+    Args:
+        config: Retry policy, read once when the decorator is created
+        retryable_exceptions: Exceptions that trigger another attempt
+
+    Returns:
+        Decorator wrapping a function with the retry policy
+    """
+    max_attempts = config.max_attempts
+    graceful_degradation = config.graceful_degradation
+    max_delay = config.max_delay
+    delays = _backoff_delays(config.backoff_multiplier, max_attempts)
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            last_exception = None
+
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except retryable_exceptions as e:
+                    last_exception = e
+
+                    if attempt < max_attempts - 1:
+                        # Jitter the delay so parallel callers don't retry in lockstep
+                        time.sleep(min(delays[attempt] * random.uniform(0.5, 1.5), max_delay))
+                    else:
+                        # Last attempt failed
+                        if graceful_degradation:
+                            return None  # type: ignore
+                        else:
+                            raise
+
+            # This shouldn't be reached, but for type safety
+            if not graceful_degradation and last_exception:
+                raise last_exception
+            return None  # type: ignore
+
+        return wrapper
+
+    return decorator
+
+
 def retry_with_backoff(
     func: Callable[[], T],
     config: RetryConfig,
-    retryable_exceptions: tuple = (ConnectionError, TimeoutError)
+    retryable_exceptions: tuple[type[BaseException], ...] = (ConnectionError, TimeoutError)
 ) -> T:
     """Execute function with exponential backoff retry logic"""
-    last_exception = None
+    return with_retry(config, retryable_exceptions)(func)()
+
+
+async def retry_with_backoff_async(
+    coro_factory: Callable[[], Awaitable[T]],
+    config: RetryConfig,
+    retryable_exceptions: tuple[type[BaseException], ...] = (ConnectionError, TimeoutError)
+) -> T:
+    """Await a fresh coroutine per attempt with exponential backoff, without blocking the loop"""
+    delays = _backoff_delays(config.backoff_multiplier, config.max_attempts)
 
     for attempt in range(config.max_attempts):
         try:
-            return func()
-        except retryable_exceptions as e:
-            last_exception = e
-
+            return await coro_factory()
+        except retryable_exceptions:
             if attempt < config.max_attempts - 1:
-                # Calculate backoff delay
-                delay = config.backoff_multiplier ** attempt
-                time.sleep(delay)
+                delay = min(delays[attempt] * random.uniform(0.5, 1.5), config.max_delay)
+                await asyncio.sleep(delay)
+            elif config.graceful_degradation:
+                return None  # type: ignore
             else:
-                # Last attempt failed
-                if config.graceful_degradation:
-                    return None  # type: ignore
-                else:
-                    raise
-
-    # This shouldn't be reached, but for type safety
-    if not config.graceful_degradation and last_exception:
-        raise last_exception
+                raise
+
     return None  # type: ignore
@@ -0,0 +1,45 @@
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+def traceable(name: str) -> Callable[[F], F]:
+    """LangSmith traceable decorator that imports langsmith on the first traced call
+
+    langsmith takes well over 100 ms to import, so modules that only define traced
+    functions (and tests that never call them) shouldn't pay for it at import time.
+
+    Args:
+        name: Run name recorded in LangSmith
+
+    Returns:
+        Decorator wrapping a sync or async function
+    """
+    def decorator(func: F) -> F:
+        traced: Callable[..., Any] | None = None
+
+        def resolve() -> Callable[..., Any]:
+            nonlocal traced
+            if traced is None:
+                from langsmith import traceable as langsmith_traceable
+
+                traced = langsmith_traceable(name=name)(func)
+            return traced
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await resolve()(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return resolve()(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
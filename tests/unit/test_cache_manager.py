@@ -1,16 +1,21 @@
-import tempfile
-from pathlib import Path
-import json
+import orjson
 import time
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from news_agent.cache.manager import CacheManager
 from news_agent.config.models import CachingConfig
 
 
+@pytest.fixture(scope="module")
+def cache_root(tmp_path_factory):
+    """One temporary directory for the whole module"""
+    return tmp_path_factory.mktemp("cache")
+
+
 @pytest.fixture
-def cache_dir():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def cache_dir(cache_root, request):
+    """Per-test subdirectory, so tests never share a cache database"""
+    return cache_root / request.node.name
 
 
 @pytest.fixture
@@ -18,6 +23,13 @@ def cache_config():
     return CachingConfig(enabled=True, ttl_hours=1)
 
 
+def write_raw_entry(cache, key, timestamp, payload):
+    """Insert a raw row into the cache database, bypassing CacheManager.set"""
+    db = cache._get_db()
+    with db:
+        db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?)", (key, timestamp, payload))
+
+
 def test_cache_set_and_get(cache_dir, cache_config):
     """Test setting and getting cached data"""
     cache = CacheManager(cache_dir, cache_config)
@@ -36,13 +48,12 @@ def test_cache_expiration(cache_dir):
     cache = CacheManager(cache_dir, config)
 
     # Set cache with old timestamp
-    cache_path = cache._get_cache_path("test_key")
-    old_cache_data = {
-        "timestamp": time.time() - (2 * 3600),  # 2 hours ago
-        "data": {"data": "value"}
-    }
-    with open(cache_path, 'w') as f:
-        json.dump(old_cache_data, f)
+    write_raw_entry(
+        cache,
+        "test_key",
+        time.time() - (2 * 3600),  # 2 hours ago
+        orjson.dumps({"data": "value"})
+    )
 
     # Should be expired
     assert cache.get("test_key") is None
@@ -57,14 +68,12 @@ def test_cache_disabled(cache_dir):
     assert cache.get("test_key") is None
 
 
-def test_corrupted_cache_file(cache_dir, cache_config):
-    """Test handling of corrupted cache files"""
+def test_corrupted_cache_entry(cache_dir, cache_config):
+    """Test handling of corrupted cache entries"""
     cache = CacheManager(cache_dir, cache_config)
 
-    # Create a corrupted cache file
-    cache_path = cache._get_cache_path("test_key")
-    with open(cache_path, 'w') as f:
-        f.write("not valid json{]")
+    # Create a corrupted cache entry
+    write_raw_entry(cache, "test_key", time.time(), b"not valid json{]")
 
     # Should return None and handle gracefully
     result = cache.get("test_key")
@@ -123,19 +132,109 @@ def test_clear_all_cache(cache_dir, cache_config):
     assert cache.get("key3") is None
 
 
-def test_cache_missing_data_key(cache_dir, cache_config):
-    """Test handling of cache files with missing 'data' key"""
+def test_cache_missing_data(cache_dir, cache_config):
+    """Test handling of cache entries with no data payload"""
     cache = CacheManager(cache_dir, cache_config)
 
-    # Create a cache file with missing 'data' key
-    cache_path = cache._get_cache_path("test_key")
-    invalid_cache_data = {
-        "timestamp": time.time()
-        # Missing 'data' key
-    }
-    with open(cache_path, 'w') as f:
-        json.dump(invalid_cache_data, f)
+    # Create a cache entry with missing data
+    write_raw_entry(cache, "test_key", time.time(), None)
 
     # Should return None and handle gracefully
     result = cache.get("test_key")
     assert result is None
+
+
+def test_cache_item_set_and_get(cache_dir, cache_config):
+    """Test storing and retrieving per-item values"""
+    cache = CacheManager(cache_dir, cache_config)
+
+    cache.set_item("relevance:1:abc", 0.8)
+    cache.set_items({"relevance:2:abc": 0.1, "relevance:3:abc": 0.5})
+
+    assert cache.get_item("relevance:1:abc") == 0.8
+    assert cache.get_item("relevance:2:abc") == 0.1
+    assert cache.get_item("relevance:3:abc") == 0.5
+    assert cache.get_item("relevance:4:abc") is None
+
+
+def test_get_items_returns_only_stored_keys(cache_dir, cache_config):
+    """Test batch item lookup skips missing keys and spans several queries"""
+    cache = CacheManager(cache_dir, cache_config)
+    cache.set_items({f"hn_item:{i}": {"id": i} for i in range(0, 1200, 2)})
+
+    found = cache.get_items([f"hn_item:{i}" for i in range(1200)])
+
+    assert found == {f"hn_item:{i}": {"id": i} for i in range(0, 1200, 2)}
+
+
+def test_get_items_drops_expired_values(cache_dir):
+    """Test batch item lookup treats expired values as missing and deletes them"""
+    config = CachingConfig(enabled=True, ttl_hours=1, item_ttl_hours=0)
+    cache = CacheManager(cache_dir, config)
+    cache.set_items({"hn_item:1": {"id": 1}})
+
+    assert cache.get_items(["hn_item:1"]) == {}
+    assert cache.get_items(["hn_item:1"], ttl_hours=1) == {}
+
+
+def test_cache_item_expiration(cache_dir):
+    """Test per-item values expire after item_ttl_hours"""
+    config = CachingConfig(enabled=True, ttl_hours=1, item_ttl_hours=0)
+    cache = CacheManager(cache_dir, config)
+
+    cache.set_item("relevance:1:abc", 0.8)
+
+    assert cache.get_item("relevance:1:abc") is None
+
+
+def test_clear_all_cache_items(cache_dir, cache_config):
+    """Test clearing all cache also removes per-item values"""
+    cache = CacheManager(cache_dir, cache_config)
+
+    cache.set_item("relevance:1:abc", 0.8)
+    cache.clear()
+
+    assert cache.get_item("relevance:1:abc") is None
+
+
+def test_failed_set_keeps_previous_entry(cache_dir, cache_config):
+    """Test a failed write leaves the previously cached value intact"""
+    cache = CacheManager(cache_dir, cache_config)
+
+    cache.set("test_key", {"data": "value"})
+    cache.set("test_key", object())
+
+    assert cache.get("test_key") == {"data": "value"}
+
+
+def test_cache_entries_stored_compressed(cache_dir, cache_config):
+    """Test entries are zstd-compressed on disk and plain JSON rows still read"""
+    cache = CacheManager(cache_dir, cache_config)
+
+    posts = [{"id": i, "text": "LLM agents " * 50} for i in range(20)]
+    cache.set("hn_posts", posts)
+
+    payload = cache._get_db().execute(
+        "SELECT data FROM entries WHERE key = ?", ("hn_posts",)
+    ).fetchone()[0]
+    assert payload[:4] == b"\x28\xb5\x2f\xfd"
+    assert len(payload) < len(orjson.dumps(posts))
+    assert cache.get("hn_posts") == posts
+
+    write_raw_entry(cache, "legacy", time.time(), orjson.dumps({"key": "value"}))
+    assert cache.get("legacy") == {"key": "value"}
+
+
+def test_concurrent_writes_from_threads(cache_dir, cache_config):
+    """Test worker threads can share one cache without interleaving transactions"""
+    cache = CacheManager(cache_dir, cache_config)
+
+    def write(i):
+        cache.set_item(f"relevance:{i}:abc", i / 100)
+        cache.set(f"entry{i}", {"value": i})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write, range(100)))
+
+    assert all(cache.get_item(f"relevance:{i}:abc") == i / 100 for i in range(100))
+    assert all(cache.get(f"entry{i}") == {"value": i} for i in range(100))
@@ -3,10 +3,20 @@ from pathlib import Path
 import pytest
 import tomli
 from pydantic import ValidationError
+from unittest.mock import patch
+from news_agent.config import loader
 from news_agent.config.loader import load_config
 from news_agent.config.models import Config
 
 
+@pytest.fixture(autouse=True)
+def config_cache_dir(tmp_path, monkeypatch):
+    """Keep the parsed-config cache out of the user's home directory"""
+    monkeypatch.delenv("NEWS_AGENT_NO_CFG_CACHE", raising=False)
+    monkeypatch.setattr(loader, "CONFIG_CACHE_DIR", tmp_path / "cfg-cache")
+    return tmp_path / "cfg-cache"
+
+
 def test_load_config_from_toml():
     """Test loading configuration from TOML file"""
     config_content = """
@@ -217,3 +227,106 @@ top_n = 101
             load_config(config_path)
     finally:
         config_path.unlink()
+
+
+def test_config_package_lazy_attributes():
+    """Test the config package exposes load_config and Config on first access"""
+    import news_agent.config as config_pkg
+
+    assert config_pkg.load_config is load_config
+    assert config_pkg.Config is Config
+
+    with pytest.raises(AttributeError):
+        _ = config_pkg.missing_attribute
+
+
+MINIMAL_CONFIG = """
+[llm]
+provider = "anthropic"
+model = "claude-3-5-sonnet-20241022"
+api_key_env = "ANTHROPIC_API_KEY"
+
+[analysis]
+depth = "medium"
+top_n = 25
+"""
+
+
+def test_load_config_reuses_cached_parse(tmp_path, config_cache_dir):
+    """Test an unchanged config file is loaded from the pickle cache"""
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(MINIMAL_CONFIG)
+
+    first = load_config(config_path)
+    assert len(list(config_cache_dir.glob("cfg-*.pkl"))) == 1
+
+    with patch.object(loader, "_parse_config") as parse:
+        second = load_config(config_path)
+
+    parse.assert_not_called()
+    assert second == first
+
+
+def test_load_config_cache_misses_when_file_changes(tmp_path):
+    """Test editing the config file invalidates the cached parse"""
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(MINIMAL_CONFIG)
+    assert load_config(config_path).analysis.top_n == 25
+
+    config_path.write_text(MINIMAL_CONFIG.replace("top_n = 25", "top_n = 5"))
+    assert load_config(config_path).analysis.top_n == 5
+
+
+def test_load_config_cache_disabled_by_env(tmp_path, config_cache_dir, monkeypatch):
+    """Test NEWS_AGENT_NO_CFG_CACHE skips the config cache entirely"""
+    monkeypatch.setenv("NEWS_AGENT_NO_CFG_CACHE", "1")
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(MINIMAL_CONFIG)
+
+    load_config(config_path)
+
+    assert not config_cache_dir.exists()
+
+
+def test_weight_sum_checked_when_popularity_defaulted():
+    """Test overriding only relevance still enforces the weight sum"""
+    from news_agent.config.models import RankingWeights
+
+    with pytest.raises(ValidationError, match="Weights must sum to 1.0"):
+        RankingWeights(relevance=0.5)
+
+    assert RankingWeights(relevance=0.4, popularity=0.6).popularity == 0.6
+
+
+def test_unknown_config_key_rejected(tmp_path):
+    """Test misspelled keys fail validation instead of being silently ignored"""
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(MINIMAL_CONFIG.replace("top_n = 25", "topn = 25"))
+
+    with pytest.raises(ValidationError, match="topn"):
+        load_config(config_path)
+
+
+def test_loaded_config_is_frozen(tmp_path):
+    """Test loaded configs cannot be mutated in place"""
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(MINIMAL_CONFIG)
+    config = load_config(config_path)
+
+    with pytest.raises(ValidationError):
+        config.analysis.depth = "deep"
+
+    analysis = config.analysis.model_copy(update={"depth": "deep"})
+    updated = config.model_copy(update={"analysis": analysis})
+    assert updated.analysis.depth == "deep"
+    assert config.analysis.depth == "medium"
+
+
+def test_save_dir_follows_copied_save_path(tmp_path):
+    """Test save_dir reflects save_path on copies rather than a stale cached value"""
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(MINIMAL_CONFIG)
+    output = load_config(config_path).output
+
+    assert output.save_dir == Path("./reports")
+    assert output.model_copy(update={"save_path": "/tmp/x"}).save_dir == Path("/tmp/x")
@@ -0,0 +1,10 @@
+from news_agent.utils.formatting import format_count
+
+
+def test_format_count():
+    """Test counts get thousands separators only when needed"""
+    assert format_count(0) == "0"
+    assert format_count(999) == "999"
+    assert format_count(1000) == "1,000"
+    assert format_count(1234567) == "1,234,567"
+    assert format_count(-2500) == "-2,500"
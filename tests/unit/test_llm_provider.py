@@ -1,14 +1,20 @@
-import os
+import asyncio
+import threading
 import pytest
-from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from news_agent.llm.cache import PromptCache
 from news_agent.llm.provider import LLMProvider, SUPPORTED_PROVIDERS
-from news_agent.config.models import LLMConfig
+from news_agent.cache.manager import CacheManager
+from news_agent.config.models import LLMConfig, CachingConfig
 from litellm.exceptions import (
     AuthenticationError,
     RateLimitError,
     Timeout,
     APIError,
-    BadRequestError
+    BadRequestError,
+    ContextWindowExceededError
 )
 
 
@@ -21,50 +27,55 @@ def llm_config():
     )
 
 
+@pytest.fixture
+def anthropic_api_key(monkeypatch):
+    """Set the provider API key for the duration of one test"""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+
+
+@pytest.fixture
+def provider(llm_config, anthropic_api_key):
+    """Provider built fresh per test, since it holds client, cache and limiter state"""
+    return LLMProvider(llm_config)
+
+
 @pytest.fixture
 def mock_response():
-    """Create a mock LiteLLM response"""
-    response = Mock()
-    response.choices = [Mock()]
-    response.choices[0].message.content = "Test response"
-    response.usage = Mock()
-    response.usage.prompt_tokens = 10
-    response.usage.completion_tokens = 20
-    response.usage.total_tokens = 30
-    return response
-
-
-def test_llm_provider_initialization(llm_config):
+    """Create a fake LiteLLM response with plain attributes"""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="Test response"))],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=20, total_tokens=30)
+    )
+
+
+def test_llm_provider_initialization(llm_config, provider):
     """Test LLM provider initializes correctly"""
-    os.environ["ANTHROPIC_API_KEY"] = "test-key"
-    provider = LLMProvider(llm_config)
     assert provider.model == "claude-3-5-sonnet-20241022"
     assert provider._api_key == "test-key"
     assert provider.config == llm_config
 
 
-def test_llm_provider_missing_api_key():
+def test_llm_provider_missing_api_key(monkeypatch):
     """Test provider raises error when API key missing"""
     config = LLMConfig(
         provider="anthropic",
         model="claude-3-5-sonnet-20241022",
         api_key_env="MISSING_KEY"
     )
-    if "MISSING_KEY" in os.environ:
-        del os.environ["MISSING_KEY"]
+    monkeypatch.delenv("MISSING_KEY", raising=False)
 
     with pytest.raises(ValueError, match="API key not found"):
         LLMProvider(config)
 
 
-def test_llm_provider_unsupported_provider():
+def test_llm_provider_unsupported_provider(monkeypatch):
     """Test provider raises error for unsupported provider"""
     config = LLMConfig(
         provider="unsupported_provider",
         model="some-model",
         api_key_env="SOME_API_KEY"
     )
-    os.environ["SOME_API_KEY"] = "test-key"
+    monkeypatch.setenv("SOME_API_KEY", "test-key")
 
     with pytest.raises(ValueError, match="Unsupported provider"):
         LLMProvider(config)
@@ -79,150 +90,137 @@ def test_supported_providers_constant():
     assert "bedrock" in SUPPORTED_PROVIDERS
 
 
-@patch('news_agent.llm.provider.completion')
-def test_complete_success(mock_completion, llm_config, mock_response):
+@patch('litellm.completion')
+def test_complete_success(mock_completion, mock_response, provider):
     """Test successful completion call"""
-    os.environ["ANTHROPIC_API_KEY"] = "test-key"
     mock_completion.return_value = mock_response
 
-    provider = LLMProvider(llm_config)
     messages = [{"role": "user", "content": "Hello"}]
 
     result = provider.complete(messages, temperature=0.5, max_tokens=512)
 
     assert result == "Test response"
-    mock_completion.assert_called_once_with(
-        model="claude-3-5-sonnet-20241022",
-        messages=messages,
-        temperature=0.5,
-        max_tokens=512,
-        api_key="test-key"
-    )
-
-
-@patch('news_agent.llm.provider.completion')
-def test_complete_json_success(mock_completion, llm_config, mock_response):
+    assert mock_completion.call_count == 1
+    assert mock_completion.call_args.kwargs == {
+        "model": "claude-3-5-sonnet-20241022",
+        "messages": messages,
+        "temperature": 0.5,
+        "max_tokens": 512,
+        "api_key": "test-key",
+        "client": provider._http,
+    }
+
+
+@patch('litellm.completion')
+def test_complete_json_success(mock_completion, mock_response, provider):
     """Test successful JSON completion call"""
-    os.environ["ANTHROPIC_API_KEY"] = "test-key"
     mock_response.choices[0].message.content = '{"key": "value"}'
     mock_completion.return_value = mock_response
 
-    provider = LLMProvider(llm_config)
     messages = [{"role": "user", "content": "Generate JSON"}]
 
     result = provider.complete_json(messages, temperature=0.3, max_tokens=1024)
 
     assert result == '{"key": "value"}'
-    mock_completion.assert_called_once()
-    call_kwargs = mock_completion.call_args[1]
-    assert call_kwargs["response_format"] == {"type": "json_object"}
-    assert call_kwargs["temperature"] == 0.3
-    assert call_kwargs["max_tokens"] == 1024
-
-
-@patch('news_agent.llm.provider.completion')
-def test_complete_empty_choices_error(mock_completion, llm_config):
+    assert mock_completion.call_count == 1
+    assert mock_completion.call_args.kwargs == {
+        "model": "claude-3-5-sonnet-20241022",
+        "messages": messages,
+        "temperature": 0.3,
+        "max_tokens": 1024,
+        "api_key": "test-key",
+        "response_format": {"type": "json_object"},
+        "client": provider._http,
+    }
+
+
+@patch('litellm.completion')
+def test_complete_empty_choices_error(mock_completion, provider):
     """Test error when API returns empty choices"""
-    os.environ["ANTHROPIC_API_KEY"] = "test-key"
-    mock_response = Mock()
-    mock_response.choices = []
-    mock_completion.return_value = mock_response
+    mock_completion.return_value = SimpleNamespace(choices=[])
 
-    provider = LLMProvider(llm_config)
     messages = [{"role": "user", "content": "Hello"}]
 
     with pytest.raises(ValueError, match="API returned empty choices list"):
         provider.complete(messages)
 
 
-@patch('news_agent.llm.provider.completion')
-def test_complete_none_content_error(mock_completion, llm_config):
+@patch('litellm.completion')
+def test_complete_none_content_error(mock_completion, provider):
     """Test error when API returns None content"""
-    os.environ["ANTHROPIC_API_KEY"] = "test-key"
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message.content = None
-    mock_completion.return_value = mock_response
+    mock_completion.return_value = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=None))]
+    )
 
-    provider = LLMProvider(llm_config)
     messages = [{"role": "user", "content": "Hello"}]
 
     with pytest.raises(ValueError, match="API returned None content in message"):
         provider.complete(messages)
 
 
-@patch('news_agent.llm.provider.completion')
-def test_complete_authentication_error(mock_completion, llm_config):
+@patch('litellm.completion')
+def test_complete_authentication_error(mock_completion, provider):
     """Test handling of authentication error"""
-    os.environ["ANTHROPIC_API_KEY"] = "test-key"
     mock_completion.side_effect = AuthenticationError(
         message="Invalid API key",
         llm_provider="anthropic",
         model="claude-3-5-sonnet-20241022"
     )
 
-    provider = LLMProvider(llm_config)
     messages = [{"role": "user", "content": "Hello"}]
 
     with pytest.raises(ValueError, match="Authentication failed. Please check your API key"):
         provider.complete(messages)
 
 
-@patch('news_agent.llm.provider.completion')
-def test_complete_rate_limit_error(mock_completion, llm_config):
+@patch('litellm.completion')
+def test_complete_rate_limit_error(mock_completion, provider):
     """Test handling of rate limit error"""
-    os.environ["ANTHROPIC_API_KEY"] = "test-key"
     mock_completion.side_effect = RateLimitError(
         message="Rate limit exceeded",
         llm_provider="anthropic",
         model="claude-3-5-sonnet-20241022"
     )
 
-    provider = LLMProvider(llm_config)
     messages = [{"role": "user", "content": "Hello"}]
 
     with pytest.raises(ValueError, match="Rate limit exceeded.*Please try again later"):
         provider.complete(messages)
 
 
-@patch('news_agent.llm.provider.completion')
-def test_complete_timeout_error(mock_completion, llm_config):
+@patch('litellm.completion')
+def test_complete_timeout_error(mock_completion, provider):
     """Test handling of timeout error"""
-    os.environ["ANTHROPIC_API_KEY"] = "test-key"
     mock_completion.side_effect = Timeout(
         message="Request timed out",
         model="claude-3-5-sonnet-20241022",
         llm_provider="anthropic"
     )
 
-    provider = LLMProvider(llm_config)
     messages = [{"role": "user", "content": "Hello"}]
 
     with pytest.raises(ValueError, match="Request to.*timed out. Please try again"):
         provider.complete(messages)
 
 
-@patch('news_agent.llm.provider.completion')
-def test_complete_bad_request_error(mock_completion, llm_config):
+@patch('litellm.completion')
+def test_complete_bad_request_error(mock_completion, provider):
     """Test handling of bad request error"""
-    os.environ["ANTHROPIC_API_KEY"] = "test-key"
     mock_completion.side_effect = BadRequestError(
         message="Invalid request format",
         model="claude-3-5-sonnet-20241022",
         llm_provider="anthropic"
     )
 
-    provider = LLMProvider(llm_config)
     messages = [{"role": "user", "content": "Hello"}]
 
     with pytest.raises(ValueError, match="Invalid request to"):
         provider.complete(messages)
 
 
-@patch('news_agent.llm.provider.completion')
-def test_complete_api_error(mock_completion, llm_config):
+@patch('litellm.completion')
+def test_complete_api_error(mock_completion, provider):
     """Test handling of general API error"""
-    os.environ["ANTHROPIC_API_KEY"] = "test-key"
     mock_completion.side_effect = APIError(
         status_code=500,
         message="General API error",
@@ -230,20 +228,32 @@ def test_complete_api_error(mock_completion, llm_config):
         model="claude-3-5-sonnet-20241022"
     )
 
-    provider = LLMProvider(llm_config)
     messages = [{"role": "user", "content": "Hello"}]
 
     with pytest.raises(ValueError, match="API error from"):
         provider.complete(messages)
 
 
-@patch('news_agent.llm.provider.completion')
-def test_api_key_passed_explicitly(mock_completion, llm_config, mock_response):
+@patch('litellm.completion')
+def test_complete_error_subclass_mapped_like_base(mock_completion, provider):
+    """Test LiteLLM exception subclasses map to their base class message"""
+    mock_completion.side_effect = ContextWindowExceededError(
+        message="Prompt too long",
+        llm_provider="anthropic",
+        model="claude-3-5-sonnet-20241022"
+    )
+
+    messages = [{"role": "user", "content": "Hello"}]
+
+    with pytest.raises(ValueError, match="Invalid request to anthropic"):
+        provider.complete(messages)
+
+
+@patch('litellm.completion')
+def test_api_key_passed_explicitly(mock_completion, mock_response, provider):
     """Test that API key is passed explicitly to completion() call"""
-    os.environ["ANTHROPIC_API_KEY"] = "test-key"
     mock_completion.return_value = mock_response
 
-    provider = LLMProvider(llm_config)
     messages = [{"role": "user", "content": "Hello"}]
 
     provider.complete(messages)
@@ -252,3 +262,239 @@ def test_api_key_passed_explicitly(mock_completion, llm_config, mock_response):
     call_kwargs = mock_completion.call_args[1]
     assert "api_key" in call_kwargs
     assert call_kwargs["api_key"] == "test-key"
+
+
+@patch('litellm.completion')
+def test_http_client_reused_across_calls(mock_completion, mock_response, provider):
+    """Test every completion shares the provider's pooled HTTP client"""
+    mock_completion.return_value = mock_response
+
+    messages = [{"role": "user", "content": "Hello"}]
+
+    provider.complete(messages)
+    provider.complete_json(messages)
+
+    clients = [call[1]["client"] for call in mock_completion.call_args_list]
+    assert clients[0] is not None
+    assert clients[0] is clients[1]
+
+    pool = clients[0].client
+    provider.close()
+    assert provider._http is None
+    assert pool.is_closed
+
+
+def test_http_client_created_once_across_threads(provider):
+    """Test concurrent first calls from worker threads share a single pooled client"""
+    barrier = threading.Barrier(8)
+
+    def first_call(_):
+        barrier.wait()
+        return provider._get_http()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(first_call, range(8)))
+
+    assert all(client is clients[0] for client in clients)
+    provider.close()
+
+
+@patch('litellm.completion')
+def test_openai_compatible_provider_uses_litellm_client(
+    mock_completion, mock_response, monkeypatch
+):
+    """Test OpenAI-compatible providers do not get an HTTPHandler client"""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    mock_completion.return_value = mock_response
+    config = LLMConfig(provider="openai", model="gpt-4o-mini", api_key_env="OPENAI_API_KEY")
+
+    provider = LLMProvider(config)
+    provider.complete([{"role": "user", "content": "Hello"}])
+
+    assert "client" not in mock_completion.call_args[1]
+
+
+@patch('litellm.completion')
+def test_completions_cached_by_request(
+    mock_completion, llm_config, mock_response, tmp_path, anthropic_api_key
+):
+    """Test identical requests hit the cache and different parameters do not"""
+    mock_completion.return_value = mock_response
+    cache = CacheManager(tmp_path, CachingConfig())
+
+    provider = LLMProvider(llm_config, cache)
+    messages = [{"role": "user", "content": "Hello"}]
+
+    assert provider.complete(messages, temperature=0.0) == "Test response"
+    assert provider.complete(messages, temperature=0.0) == "Test response"
+    assert mock_completion.call_count == 1
+
+    provider.complete(messages, temperature=0.5)
+    assert mock_completion.call_count == 2
+
+
+@patch('litellm.completion')
+def test_completions_not_cached_when_caching_disabled(
+    mock_completion, llm_config, mock_response, tmp_path, anthropic_api_key
+):
+    """Test caching.enabled = false always calls the LLM"""
+    mock_completion.return_value = mock_response
+    cache = CacheManager(tmp_path, CachingConfig(enabled=False))
+
+    provider = LLMProvider(llm_config, cache)
+    messages = [{"role": "user", "content": "Hello"}]
+
+    provider.complete(messages)
+    provider.complete(messages)
+
+    assert mock_completion.call_count == 2
+
+
+@patch('litellm.completion')
+def test_completions_shared_through_disk_cache(
+    mock_completion, llm_config, mock_response, tmp_path, anthropic_api_key
+):
+    """Test a new provider reuses completions another provider stored on disk"""
+    mock_completion.return_value = mock_response
+    cache = CacheManager(tmp_path, CachingConfig())
+    messages = [{"role": "user", "content": "Hello"}]
+
+    LLMProvider(llm_config, cache).complete(messages)
+    assert LLMProvider(llm_config, cache).complete(messages) == "Test response"
+
+    assert mock_completion.call_count == 1
+
+
+@patch('litellm.completion')
+def test_completions_not_cached_when_prompt_cache_disabled(
+    mock_completion, llm_config, mock_response, anthropic_api_key
+):
+    """Test cache_enabled = false always calls the LLM"""
+    mock_completion.return_value = mock_response
+    provider = LLMProvider(llm_config.model_copy(update={"cache_enabled": False}))
+    messages = [{"role": "user", "content": "Hello"}]
+
+    provider.complete(messages)
+    provider.complete(messages)
+
+    assert mock_completion.call_count == 2
+
+
+def test_prompt_cache_evicts_least_recently_used():
+    """Test the in-memory prompt cache keeps only the most recently used entries"""
+    cache = PromptCache(maxsize=2)
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+@pytest.mark.asyncio
+@patch('litellm.acompletion', new_callable=AsyncMock)
+async def test_acomplete_success(mock_acompletion, mock_response, provider):
+    """Test async completion awaits litellm.acompletion"""
+    mock_acompletion.return_value = mock_response
+
+    messages = [{"role": "user", "content": "Hello"}]
+
+    result = await provider.acomplete_json(messages, temperature=0.0, max_tokens=64)
+
+    assert result == "Test response"
+    assert mock_acompletion.await_count == 1
+    assert mock_acompletion.call_args.kwargs == {
+        "model": "claude-3-5-sonnet-20241022",
+        "messages": messages,
+        "temperature": 0.0,
+        "max_tokens": 64,
+        "api_key": "test-key",
+        "response_format": {"type": "json_object"},
+        "client": provider._ahttp,
+    }
+
+
+@pytest.mark.asyncio
+@patch('litellm.acompletion', new_callable=AsyncMock)
+async def test_acomplete_maps_errors(mock_acompletion, provider):
+    """Test async completion raises the same errors as complete()"""
+    mock_acompletion.side_effect = RateLimitError(
+        message="Rate limit exceeded",
+        llm_provider="anthropic",
+        model="claude-3-5-sonnet-20241022"
+    )
+
+    with pytest.raises(ValueError, match="Rate limit exceeded.*Please try again later"):
+        await provider.acomplete([{"role": "user", "content": "Hello"}])
+
+
+@patch('litellm.acompletion', new_callable=AsyncMock)
+def test_async_http_client_reused_per_loop(
+    mock_acompletion, llm_config, mock_response, anthropic_api_key
+):
+    """Test async completions share one pooled client per event loop"""
+    mock_acompletion.return_value = mock_response
+    # Every call has to reach litellm, so keep the prompt cache out of the way
+    provider = LLMProvider(llm_config.model_copy(update={"cache_enabled": False}))
+    messages = [{"role": "user", "content": "Hello"}]
+
+    async def two_calls():
+        await provider.acomplete(messages)
+        await provider.acomplete(messages, temperature=0.1)
+        clients = [call[1]["client"] for call in mock_acompletion.call_args_list[-2:]]
+        await provider.aclose()
+        return clients
+
+    first = asyncio.run(two_calls())
+    second = asyncio.run(two_calls())
+
+    assert first[0] is not None
+    assert first[0] is first[1]
+    assert second[0] is not first[0]
+    assert provider._ahttp is None
+
+
+@patch('litellm.acompletion', new_callable=AsyncMock)
+def test_acomplete_rate_limit_halves_concurrency(mock_acompletion, llm_config, anthropic_api_key):
+    """Test a rate-limited async call lowers the provider's concurrency cap"""
+    mock_acompletion.side_effect = RateLimitError(
+        message="Rate limit exceeded",
+        llm_provider="anthropic",
+        model="claude-3-5-sonnet-20241022"
+    )
+    provider = LLMProvider(llm_config.model_copy(update={"max_concurrency": 8}))
+
+    with pytest.raises(ValueError, match="Rate limit exceeded"):
+        asyncio.run(provider.acomplete([{"role": "user", "content": "Hello"}]))
+
+    assert provider._concurrency.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_acomplete_many_bounds_concurrency(mock_response, provider):
+    """Test fan-out keeps at most max_concurrency calls in flight and preserves order"""
+    in_flight = 0
+    peak = 0
+
+    async def fake_acompletion(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if kwargs["messages"][0]["content"] == "fail":
+            raise ValueError("boom")
+        return mock_response
+
+    messages_list = [[{"role": "user", "content": f"Hello {i}"}] for i in range(6)]
+    messages_list.append([{"role": "user", "content": "fail"}])
+
+    with patch('litellm.acompletion', new=fake_acompletion):
+        results = await provider.acomplete_many(messages_list, max_concurrency=2)
+
+    assert peak == 2
+    assert results[:6] == ["Test response"] * 6
+    assert isinstance(results[6], ValueError)
@@ -66,3 +66,30 @@ def test_generate_full_report():
     assert "## Hacker News" in markdown
     assert "test/repo" in markdown
     assert "Test Post" in markdown
+
+
+def test_generate_report_separates_sections():
+    """Test that only present sections are written, each separated once"""
+    generator = MarkdownGenerator()
+
+    markdown = generator.generate_report({
+        "github_repos": [],
+        "hn_posts": [{"title": "Only Post", "hn_url": "https://news.ycombinator.com/item?id=1"}],
+        "metadata": {"sources": ["hackernews"]}
+    })
+
+    sections = markdown.split("\n\n---\n\n")
+    assert len(sections) == 3
+    assert sections[0].startswith("# News Agent Report")
+    assert sections[1].startswith("## Hacker News")
+    assert sections[2].startswith("## Summary")
+    assert "GitHub" not in sections[2]
+
+
+def test_generate_report_uses_fixed_time():
+    """Test that an injected generation time is formatted as 12-hour clock"""
+    generator = MarkdownGenerator(clock=lambda: datetime(2025, 1, 9, 0, 5))
+
+    markdown = generator.generate_report({"metadata": {}})
+
+    assert "**Generated:** 2025-01-09 12:05 AM" in markdown
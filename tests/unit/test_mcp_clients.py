@@ -0,0 +1,142 @@
+import asyncio
+import orjson
+import pytest
+from unittest.mock import Mock
+from news_agent import mcp
+from news_agent.mcp.github_client import GitHubMCPClient
+from news_agent.mcp.hn_client import HackerNewsMCPClient
+from news_agent.config.models import GitHubSourceConfig, HackerNewsSourceConfig
+
+
+@pytest.fixture
+def github_client():
+    return GitHubMCPClient(GitHubSourceConfig(enabled=True, mcp_server="local"))
+
+
+@pytest.fixture
+def hn_client():
+    return HackerNewsMCPClient(
+        HackerNewsSourceConfig(enabled=True, mcp_server="local", endpoints=["newest"])
+    )
+
+
+def test_clients_share_one_http_client(github_client, hn_client):
+    """Test GitHub and HN clients reuse the same pooled HTTP client"""
+    async def check():
+        shared = github_client._get_http()
+        assert hn_client._get_http() is shared
+
+        await hn_client.aclose()
+        assert shared.is_closed
+        assert github_client._get_http() is not shared
+        await github_client.aclose()
+
+    asyncio.run(check())
+
+
+def test_http_client_recreated_for_new_event_loop(hn_client):
+    """Test a client left open on a finished loop is not reused by the next one"""
+    async def get():
+        return hn_client._get_http()
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+
+    assert second is not first
+    asyncio.run(mcp.aclose_client())
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.status_code = 200
+        self.content = orjson.dumps(payload)
+
+
+class FakeHNClient:
+    """Stands in for httpx.AsyncClient, recording requested URLs"""
+
+    def __init__(self, story_ids):
+        self.story_ids = story_ids
+        self.requested = []
+
+    async def get(self, url):
+        self.requested.append(url)
+        if url.endswith("newstories.json"):
+            return FakeResponse(self.story_ids)
+        item_id = int(url.rsplit("/", 1)[1].removesuffix(".json"))
+        return FakeResponse({"id": item_id, "type": "story", "title": f"Story {item_id}"})
+
+
+def test_fetch_posts_skips_cached_items():
+    """Test stories already in the item cache are not fetched again"""
+    cached_story = {"id": 1, "title": "Cached story", "url": "https://example.com/1"}
+    cache = Mock()
+    cache.config.ttl_hours = 1
+    cache.get_items.side_effect = lambda keys, ttl_hours=None: (
+        {"hn_item:1": cached_story} if "hn_item:1" in keys else {}
+    )
+    client = HackerNewsMCPClient(
+        HackerNewsSourceConfig(enabled=True, mcp_server="local", endpoints=["newest"]),
+        cache
+    )
+    http = FakeHNClient([1, 2])
+    client._get_http = lambda: http
+
+    posts = asyncio.run(client.fetch_posts_async("newest", limit=2))
+
+    assert [post["title"] for post in posts] == ["Cached story", "Story 2"]
+    assert not any(url.endswith("/item/1.json") for url in http.requested)
+    written = cache.set_items.call_args[0][0]
+    assert list(written) == ["hn_item:2"]
+    cache.get_items.assert_called_once_with(["hn_item:1", "hn_item:2"], ttl_hours=1)
+
+
+def test_filter_by_topics_matches_title_or_text():
+    """Test topic filtering is case-insensitive and checks both title and text"""
+    client = HackerNewsMCPClient(HackerNewsSourceConfig(
+        enabled=True,
+        mcp_server="local",
+        endpoints=["newest"],
+        filter_topics=["LLM", "machine learning"]
+    ))
+    stories = [
+        {"id": 1, "title": "Fine-tuning llms on a laptop", "text": ""},
+        {"id": 2, "title": "Ask HN: Career advice", "text": "Getting into Machine Learning?"},
+        {"id": 3, "title": "Gardening tips", "text": ""},
+    ]
+
+    assert [story["id"] for story in client._filter_by_topics(stories)] == [1, 2]
+
+
+def test_sync_wrappers_reuse_one_event_loop(hn_client):
+    """Test back-to-back sync calls run on the same persistent event loop"""
+    loops = []
+
+    async def fake_fetch(endpoint, limit):
+        loops.append(asyncio.get_running_loop())
+        return []
+
+    hn_client._fetch_posts_async = fake_fetch
+
+    hn_client.fetch_posts("newest")
+    hn_client.fetch_posts("show")
+
+    assert loops[0] is loops[1]
+
+
+def test_github_error_body_truncated_in_log(github_client, caplog):
+    """Test a large GitHub error body is logged only up to 512 bytes"""
+    response = Mock(status_code=500, content=b"x" * 10_000)
+    http = Mock()
+
+    async def get(*args, **kwargs):
+        return response
+
+    http.get = get
+    github_client._get_http = lambda: http
+
+    repos = asyncio.run(github_client.fetch_trending_repositories_async())
+
+    assert repos == []
+    message = next(r.getMessage() for r in caplog.records if "GitHub API error" in r.getMessage())
+    assert message == "GitHub API error: 500 - " + "x" * 512
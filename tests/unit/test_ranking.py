@@ -40,3 +40,42 @@ def test_popularity_ranking():
     assert ranked[0]["id"] == 2
     assert ranked[1]["id"] == 3
     assert ranked[2]["id"] == 1
+
+
+def test_ranking_top_n():
+    """Test ranking returns only the top N items in order"""
+    config = RankingConfig(strategy="relevance")
+    ranker = Ranker(config)
+
+    items = [{"id": i, "relevance_score": i / 10} for i in range(10)]
+
+    ranked = ranker.rank(items, top_n=3)
+    assert [item["id"] for item in ranked] == [9, 8, 7]
+
+
+def test_balanced_ranking_preserves_order_on_ties():
+    """Test items with equal combined scores keep their input order"""
+    config = RankingConfig(strategy="balanced")
+    ranker = Ranker(config)
+
+    items = [
+        {"id": 1, "relevance_score": 0.5, "popularity_score": 0.5},
+        {"id": 2, "relevance_score": 0.9, "popularity_score": 0.9},
+        {"id": 3, "relevance_score": 0.5, "popularity_score": 0.5},
+    ]
+
+    assert [item["id"] for item in ranker.rank(items)] == [2, 1, 3]
+    assert [item["id"] for item in ranker.rank(items, top_n=2)] == [2, 1]
+
+
+def test_normalize_scores():
+    """Test scores are scaled to the 0-1 range"""
+    ranker = Ranker(RankingConfig())
+
+    items = [{"score": 10}, {"score": 30}, {"score": 20}]
+    ranker.normalize_scores(items, "score")
+    assert [item["score_normalized"] for item in items] == [0.0, 1.0, 0.5]
+
+    same = [{"score": 5}, {"score": 5}]
+    ranker.normalize_scores(same, "score")
+    assert [item["score_normalized"] for item in same] == [0.5, 0.5]
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from news_agent.llm.ratelimit import AIMDController, SlidingWindowLimiter, _parse_reset
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_limiter_enforces_requests_per_minute():
+    """Test requests beyond the RPM limit wait for the oldest to leave the window"""
+    clock = FakeClock()
+    limiter = SlidingWindowLimiter(rpm=2, clock=clock)
+
+    assert limiter._reserve(0) == 0
+    clock.now += 10
+    assert limiter._reserve(0) == 0
+    assert limiter._reserve(0) == pytest.approx(50)
+
+    clock.now += 50
+    assert limiter._reserve(0) == 0
+
+
+def test_limiter_enforces_tokens_per_minute():
+    """Test a request that would exceed the TPM limit waits for enough tokens to expire"""
+    clock = FakeClock()
+    limiter = SlidingWindowLimiter(tpm=1000, clock=clock)
+
+    assert limiter._reserve(600) == 0
+    clock.now += 5
+    assert limiter._reserve(300) == 0
+    assert limiter._reserve(500) == pytest.approx(55)
+
+    # A single request larger than the limit is still admitted when the window is empty
+    clock.now += 60
+    assert limiter._reserve(5000) == 0
+
+
+def test_limiter_oversized_request_waits_for_empty_window():
+    """Test a request estimated above the TPM limit waits for the window to drain"""
+    clock = FakeClock()
+    limiter = SlidingWindowLimiter(tpm=1000, clock=clock)
+
+    assert limiter._reserve(600) == 0
+    clock.now += 5
+    assert limiter._reserve(5000) == pytest.approx(55)
+
+    clock.now += 55
+    assert limiter._reserve(5000) == 0
+    # It used the whole budget, so the next request waits a full window
+    assert limiter._reserve(1) == pytest.approx(60)
+
+
+def test_limiter_pauses_on_exhausted_headers():
+    """Test exhausted-limit response headers block new requests until the reset"""
+    clock = FakeClock()
+    limiter = SlidingWindowLimiter(clock=clock)
+
+    limiter.observe_headers({
+        "x-ratelimit-remaining-requests": "5", "x-ratelimit-reset-requests": "30s"
+    })
+    assert limiter._reserve(0) == 0
+
+    limiter.observe_headers({
+        "llm_provider-anthropic-ratelimit-requests-remaining": "0",
+        "x-ratelimit-reset-requests": "1m30s",
+        "llm_provider-anthropic-ratelimit-requests-reset": "2s",
+    })
+    assert limiter._reserve(0) == pytest.approx(2)
+
+    clock.now += 2
+    assert limiter._reserve(0) == 0
+
+
+def test_parse_reset_formats():
+    """Test reset headers parse as durations or timestamps"""
+    assert _parse_reset("6m0s") == 360
+    assert _parse_reset("20ms") == pytest.approx(0.02)
+    assert _parse_reset("1970-01-01T00:00:00Z") == 0
+    assert _parse_reset("soon") is None
+
+
+def test_aimd_controller_adjusts_and_caps_concurrency():
+    """Test throttles halve the cap, successes regrow it, and slots respect it"""
+    controller = AIMDController(max_concurrency=8)
+
+    controller.on_throttle()
+    controller.on_throttle()
+    assert controller.limit == 2
+    controller.on_success()
+    assert controller.limit == 2.5
+
+    in_flight = 0
+    peak = 0
+
+    async def call():
+        nonlocal in_flight, peak
+        async with controller.slot():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+    async def run_all():
+        await asyncio.gather(*[call() for _ in range(6)])
+
+    asyncio.run(run_all())
+    assert peak == 2
@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import Mock
 from news_agent.analysis.relevance import RelevanceScorer
 from news_agent.llm.provider import LLMProvider
 from news_agent.config.models import LLMConfig, AnalysisConfig
@@ -34,3 +35,110 @@ def test_score_hn_post_relevance(llm_config, analysis_config):
 
     assert 0.0 <= score <= 1.0
     assert score > 0.7  # Should be highly relevant
+
+
+def test_score_hn_posts_batch(analysis_config):
+    """Test batch scoring maps scores back to posts by id"""
+    provider = Mock()
+    provider.complete_json.return_value = (
+        '{"scores": [{"id": 1, "relevance_score": 0.2}, {"id": 0, "relevance_score": 0.9}]}'
+    )
+    scorer = RelevanceScorer(provider, analysis_config)
+
+    posts = [
+        {"title": "New LLM released", "url": "https://example.com/llm", "text": ""},
+        {"title": "Gardening tips", "url": "https://example.com/garden", "text": ""},
+    ]
+
+    scores = scorer.score_hn_posts_batch(posts, topics=["AI", "LLM"])
+
+    assert scores == [0.9, 0.2]
+    provider.complete_json.assert_called_once()
+
+
+def test_score_hn_posts_batch_falls_back_for_missing_ids(analysis_config):
+    """Test posts missing from the batch response are scored individually"""
+    provider = Mock()
+    provider.complete_json.side_effect = [
+        '{"scores": [{"id": 0, "relevance_score": 0.8}]}',
+        '{"relevance_score": 0.4}',
+    ]
+    scorer = RelevanceScorer(provider, analysis_config)
+
+    posts = [
+        {"title": "AI agents", "url": "https://example.com/a", "text": ""},
+        {"title": "ML pipelines", "url": "https://example.com/b", "text": ""},
+    ]
+
+    scores = scorer.score_hn_posts_batch(posts, topics=["AI", "ML"])
+
+    assert scores == [0.8, 0.4]
+    assert provider.complete_json.call_count == 2
+
+
+def test_extract_json_ignores_surrounding_text(analysis_config):
+    """Test JSON is extracted from responses with extra text around it"""
+    scorer = RelevanceScorer(Mock(), analysis_config)
+
+    assert scorer._extract_json('{"relevance_score": 0.7}') == {"relevance_score": 0.7}
+    assert scorer._extract_json(
+        'Here you go: {"relevance_score": 0.6} Hope that helps {}'
+    ) == {"relevance_score": 0.6}
+    assert scorer._extract_json(
+        '```json\n{"relevance_score": 0.5}\n```'
+    ) == {"relevance_score": 0.5}
+    assert scorer._extract_json("no json here") is None
+
+
+def test_extract_json_ignores_non_object_json(analysis_config):
+    """Test a JSON list or bare number is treated as unparseable"""
+    scorer = RelevanceScorer(Mock(), analysis_config)
+
+    assert scorer._extract_json("[0.9]") is None
+    assert scorer._extract_json("0.9") is None
+
+
+def test_score_hn_post_requests_only_the_score(analysis_config):
+    """Test the single-post prompt asks for nothing beyond relevance_score"""
+    provider = Mock()
+    provider.complete_json.return_value = "not json"
+    scorer = RelevanceScorer(provider, analysis_config)
+
+    score = scorer.score_hn_post({"title": "LLM agents", "url": "", "text": ""}, topics=["LLM"])
+
+    prompt = provider.complete_json.call_args[0][0][0]["content"]
+    assert score is None
+    assert "reasoning" not in prompt
+    assert "key_topics" not in prompt
+
+
+def test_score_hn_posts_batch_marks_unparseable_replies(analysis_config):
+    """Test posts whose replies can't be parsed come back as None rather than 0.0"""
+    provider = Mock()
+    provider.complete_json.side_effect = ["Sorry, I can't help", '{"reasoning": "n/a"}']
+    scorer = RelevanceScorer(provider, analysis_config)
+
+    scores = scorer.score_hn_posts_batch(
+        [{"title": "AI agents", "url": "https://example.com/a", "text": ""}], topics=["AI"]
+    )
+
+    assert scores == [None]
+
+
+def test_score_hn_posts_batches_concurrently():
+    """Test batches scored on a thread pool keep their order"""
+    provider = Mock()
+    provider.complete_json.side_effect = lambda messages, **kwargs: (
+        '{"scores": [{"id": 0, "relevance_score": 0.3}]}'
+        if "Gardening" in messages[0]["content"]
+        else '{"scores": [{"id": 0, "relevance_score": 0.9}]}'
+    )
+    scorer = RelevanceScorer(provider, AnalysisConfig(relevance_concurrency=2))
+
+    batches = [
+        [{"title": "LLM agents", "url": "https://example.com/a", "text": ""}],
+        [{"title": "Gardening tips", "url": "https://example.com/b", "text": ""}],
+    ]
+
+    assert scorer.score_hn_posts_batches(batches, topics=["LLM"]) == [[0.9], [0.3]]
+    assert provider.complete_json.call_count == 2
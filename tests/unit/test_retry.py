@@ -1,5 +1,7 @@
 import pytest
-from news_agent.utils.retry import retry_with_backoff
+import asyncio
+from unittest.mock import AsyncMock, patch
+from news_agent.utils.retry import retry_with_backoff, retry_with_backoff_async, with_retry
 from news_agent.config.models import RetryConfig
 
 
@@ -46,3 +48,71 @@ def test_retry_fails_after_max_attempts():
 
     with pytest.raises(ValueError):
         retry_with_backoff(always_fails, config)
+
+
+def test_retry_backoff_delays_are_jittered():
+    """Test exponential delays are scaled by a jitter factor"""
+    config = RetryConfig(max_attempts=3, backoff_multiplier=2, graceful_degradation=True)
+
+    def always_fails():
+        raise ConnectionError("Network error")
+
+    with patch("news_agent.utils.retry.time.sleep") as mock_sleep, \
+            patch("news_agent.utils.retry.random.uniform", return_value=1.5):
+        assert retry_with_backoff(always_fails, config) is None
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1.5, 3.0]
+
+
+def test_with_retry_decorator_passes_arguments():
+    """Test the decorator retries and forwards call arguments"""
+    config = RetryConfig(max_attempts=3, backoff_multiplier=1)
+    calls = []
+
+    @with_retry(config)
+    def flaky(value, suffix=""):
+        calls.append(value)
+        if len(calls) < 2:
+            raise TimeoutError("Timed out")
+        return f"{value}{suffix}"
+
+    with patch("news_agent.utils.retry.time.sleep"):
+        assert flaky("ok", suffix="!") == "ok!"
+    assert calls == ["ok", "ok"]
+    assert flaky.__name__ == "flaky"
+
+
+def test_retry_async_succeeds_after_failures():
+    """Test async retry awaits a new coroutine per attempt"""
+    config = RetryConfig(max_attempts=3, backoff_multiplier=2)
+    call_count = 0
+
+    async def eventually_succeeds():
+        nonlocal call_count
+        call_count += 1
+        if call_count < 3:
+            raise ConnectionError("Network error")
+        return "success"
+
+    with patch("news_agent.utils.retry.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        result = asyncio.run(retry_with_backoff_async(eventually_succeeds, config))
+
+    assert result == "success"
+    assert call_count == 3
+    assert mock_sleep.await_count == 2
+
+
+def test_retry_async_delays_capped_by_max_delay():
+    """Test async backoff sleeps never exceed max_delay"""
+    config = RetryConfig(
+        max_attempts=5, backoff_multiplier=4, max_delay=10.0, graceful_degradation=True
+    )
+
+    async def always_fails():
+        raise ConnectionError("Network error")
+
+    with patch("news_agent.utils.retry.asyncio.sleep", new=AsyncMock()) as mock_sleep, \
+            patch("news_agent.utils.retry.random.uniform", return_value=1.5):
+        assert asyncio.run(retry_with_backoff_async(always_fails, config)) is None
+
+    assert [c.args[0] for c in mock_sleep.await_args_list] == [1.5, 6.0, 10.0, 10.0]
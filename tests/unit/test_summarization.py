@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import Mock
 from news_agent.analysis.summarization import Summarizer
 from news_agent.llm.provider import LLMProvider
 from news_agent.config.models import LLMConfig, AnalysisConfig
@@ -31,3 +32,42 @@ def test_summarize_article(llm_config):
     summary = summarizer.summarize_article(article)
     assert len(summary) > 0
     assert len(summary) < 200  # Lightweight should be brief
+
+
+def test_summarize_articles_batch():
+    """Test batch summarization maps summaries back by id and falls back per article"""
+    provider = Mock()
+    provider.complete_json.return_value = (
+        '{"summaries": [{"id": 2, "summary": "Third"}, {"id": 0, "summary": "First"}]}'
+    )
+    provider.complete.return_value = "Second (single)"
+    summarizer = Summarizer(provider, AnalysisConfig(summary_batch_size=3))
+
+    articles = [
+        {"title": f"Article {i}", "url": f"https://example.com/{i}", "text": "..."}
+        for i in range(4)
+    ]
+
+    summaries = summarizer.summarize_articles_batch(articles)
+
+    assert summaries == ["First", "Second (single)", "Third", "Second (single)"]
+    provider.complete_json.assert_called_once()
+    assert provider.complete.call_count == 2
+
+
+def test_summarize_articles_batch_accepts_fenced_json():
+    """Test a batch reply wrapped in a code fence is parsed instead of falling back"""
+    provider = Mock()
+    provider.complete_json.return_value = (
+        'Here are the summaries:\n```json\n'
+        '{"summaries": [{"id": 0, "summary": "First"}, {"id": 1, "summary": "Second"}]}\n```'
+    )
+    summarizer = Summarizer(provider, AnalysisConfig(summary_batch_size=2))
+
+    articles = [
+        {"title": f"Article {i}", "url": f"https://example.com/{i}", "text": "..."}
+        for i in range(2)
+    ]
+
+    assert summarizer.summarize_articles_batch(articles) == ["First", "Second"]
+    provider.complete.assert_not_called()
@@ -1,3 +1,6 @@
+import io
+import logging
+from rich.console import Console
 from news_agent.output.terminal import TerminalDisplay
 
 
@@ -26,3 +29,76 @@ def test_display_progress():
     display.show_progress("Fetching GitHub trending...")
     display.show_success("GitHub data fetched successfully")
     display.show_error("Test error message")
+
+
+def test_preview_truncates_long_titles():
+    """Test long titles are cut with an ellipsis by the table column"""
+    output = io.StringIO()
+    display = TerminalDisplay(console=Console(file=output, width=200))
+
+    display.show_hn_preview([{"title": "x" * 100, "score": 1, "comments_count": 2}])
+
+    assert "x" * 62 + "…" in output.getvalue()
+    assert "x" * 63 not in output.getvalue()
+
+
+def test_displays_share_console():
+    """Test displays reuse one console unless given their own"""
+    assert TerminalDisplay().console is TerminalDisplay().console
+
+    output = io.StringIO()
+    display = TerminalDisplay(console=Console(file=output))
+    display.show_success("Saved")
+    assert "Saved" in output.getvalue()
+
+
+def test_batch_messages_plain_and_rich():
+    """Test status messages are written as plain lines off-terminal and via rich on a terminal"""
+    messages = [("warning", "Dry run [no fetch]"), ("progress", "Would fetch from sources: github")]
+
+    plain = io.StringIO()
+    TerminalDisplay(console=Console(file=plain)).batch_messages(messages)
+    assert plain.getvalue() == "⚠ Dry run [no fetch]\n⏳ Would fetch from sources: github\n"
+
+    styled = io.StringIO()
+    TerminalDisplay(console=Console(file=styled, force_terminal=True)).batch_messages(messages)
+    assert "Dry run [no fetch]" in styled.getvalue()
+    assert "\x1b[" in styled.getvalue()
+
+
+def test_status_without_terminal_writes_progress_line():
+    """Test status falls back to a single progress line when not on a terminal"""
+    output = io.StringIO()
+    display = TerminalDisplay(console=Console(file=output))
+
+    with display.status("Running news agent..."):
+        pass
+
+    assert output.getvalue() == "⏳ Running news agent...\n"
+
+
+def test_logging_handler_prints_through_terminal_console():
+    """On a terminal, log records go through the display's console, above the spinner"""
+    out = io.StringIO()
+    display = TerminalDisplay(console=Console(file=out, force_terminal=True, width=80))
+
+    handler = display.logging_handler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger = logging.getLogger("test_terminal_output.logging_handler")
+    logger.addHandler(handler)
+    try:
+        with display.status("Working..."):
+            logger.warning("cache miss [b]x[/b]")
+    finally:
+        logger.removeHandler(handler)
+
+    assert "cache miss [b]x[/b]" in out.getvalue()
+
+
+def test_logging_handler_without_terminal_uses_stderr():
+    """Without a terminal, log records stay on stderr"""
+    display = TerminalDisplay(console=Console(file=io.StringIO(), force_terminal=False))
+
+    handler = display.logging_handler()
+
+    assert type(handler) is logging.StreamHandler
@@ -0,0 +1,94 @@
+import pytest
+from unittest.mock import Mock
+from news_agent.agent.tools import ToolRegistry
+from news_agent.config.models import AnalysisConfig
+
+
+@pytest.fixture
+def relevance_scorer():
+    scorer = Mock()
+    scorer.config = AnalysisConfig()
+    scorer.score_hn_posts_batches.side_effect = lambda batches, topics: [
+        [0.9] * len(batch) for batch in batches
+    ]
+    return scorer
+
+
+@pytest.fixture
+def cache_manager():
+    cache = Mock()
+    cache.get_item.return_value = None
+    return cache
+
+
+@pytest.fixture
+def tool_registry(relevance_scorer, cache_manager):
+    return ToolRegistry(Mock(), Mock(), relevance_scorer, Mock(), cache_manager)
+
+
+def test_score_relevance_skips_posts_without_topic_mentions(tool_registry, relevance_scorer):
+    """Test posts with no topic keywords are scored 0.0 without calling the LLM"""
+    items = [
+        {"id": 1, "title": "Fine-tuning an LLM on a laptop", "text": ""},
+        {"id": 2, "title": "Growing tomatoes on a balcony", "text": ""},
+        {"id": 3, "title": "Show HN: my blog", "text": "Notes on ai agents"},
+    ]
+
+    scored = tool_registry.tools["score_relevance"](items, ["AI", "LLM"])
+
+    assert [item["relevance_score"] for item in scored] == [0.9, 0.0, 0.9]
+    relevance_scorer.score_hn_posts_batches.assert_called_once()
+    sent = relevance_scorer.score_hn_posts_batches.call_args[0][0]
+    assert [[item["id"] for item in batch] for batch in sent] == [[1, 3]]
+
+
+def test_score_relevance_matches_plurals_and_compounds(tool_registry, relevance_scorer):
+    """Test topic mentions inside longer words still reach the LLM"""
+    items = [
+        {"id": 1, "title": "New LLMs beat benchmarks", "text": ""},
+        {"id": 2, "title": "OpenAI releases GPT-5", "text": ""},
+        {"id": 3, "title": "Fine-tuning LLMs on a laptop", "text": ""},
+    ]
+
+    topics = ["AI", "ML", "GenAI", "LLM", "machine learning"]
+    scored = tool_registry.tools["score_relevance"](items, topics)
+
+    assert [item["relevance_score"] for item in scored] == [0.9, 0.9, 0.9]
+    sent = relevance_scorer.score_hn_posts_batches.call_args[0][0]
+    assert [[item["id"] for item in batch] for batch in sent] == [[1, 2, 3]]
+
+
+def test_score_relevance_uses_cached_scores(tool_registry, relevance_scorer, cache_manager):
+    """Test previously scored posts are not sent to the LLM again"""
+    cache_manager.get_item.side_effect = lambda key: 0.6 if key.startswith("relevance:1:") else None
+    items = [
+        {"id": 1, "title": "LLM inference tricks", "text": ""},
+        {"id": 2, "title": "LLM evaluation", "text": ""},
+    ]
+
+    scored = tool_registry.tools["score_relevance"](items, ["LLM"])
+
+    assert [item["relevance_score"] for item in scored] == [0.6, 0.9]
+    sent = relevance_scorer.score_hn_posts_batches.call_args[0][0]
+    assert [[item["id"] for item in batch] for batch in sent] == [[2]]
+    cached = cache_manager.set_items.call_args[0][0]
+    assert list(cached.values()) == [0.9]
+
+
+def test_score_relevance_does_not_cache_unparseable_scores(
+    tool_registry, relevance_scorer, cache_manager
+):
+    """Test posts the LLM reply couldn't score get 0.0 now but are retried next run"""
+    relevance_scorer.score_hn_posts_batches.side_effect = lambda batches, topics: [[0.7, None]]
+    items = [
+        {"id": 1, "title": "LLM inference tricks", "text": ""},
+        {"id": 2, "title": "LLM evaluation", "text": ""},
+    ]
+
+    scored = tool_registry.tools["score_relevance"](items, ["LLM"])
+
+    assert [item["relevance_score"] for item in scored] == [0.7, 0.0]
+    cached = cache_manager.set_items.call_args[0][0]
+    assert [key.split(":")[1] for key in cached] == ["1"]
+    assert list(cached.values()) == [0.7]
+
@@ -0,0 +1,27 @@
+import asyncio
+import inspect
+from news_agent.utils.tracing import traceable
+
+
+def test_traceable_wraps_sync_function(monkeypatch):
+    """Test traced sync functions keep their name and return value"""
+    monkeypatch.setenv("LANGSMITH_TRACING", "false")
+
+    @traceable(name="add")
+    def add(a, b):
+        return a + b
+
+    assert add.__name__ == "add"
+    assert add(1, b=2) == 3
+
+
+def test_traceable_wraps_async_function(monkeypatch):
+    """Test traced coroutine functions stay awaitable"""
+    monkeypatch.setenv("LANGSMITH_TRACING", "false")
+
+    @traceable(name="double")
+    async def double(value):
+        return value * 2
+
+    assert inspect.iscoroutinefunction(double)
+    assert asyncio.run(double(21)) == 42